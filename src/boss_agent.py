@@ -8,7 +8,7 @@ and managing the overall execution flow.
 
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Type
 from enum import Enum
 
 from agents.base_agent import AgentContext
@@ -49,7 +49,10 @@ class BossAgent:
         logger: StructuredLogger,
         model_router: 'ModelRouter',
         max_retries: int = 3,
-        confidence_threshold: float = 0.70
+        confidence_threshold: float = 0.70,
+        research_agent_cls: Type[ResearchAgent] = ResearchAgent,
+        analyst_agent_cls: Type[AnalystAgent] = AnalystAgent,
+        strategy_agent_cls: Type[StrategyAgent] = StrategyAgent
     ):
         """
         Initialize Boss Agent
@@ -60,6 +63,9 @@ class BossAgent:
             model_router: Model router for LLM calls
             max_retries: Maximum retries per agent
             confidence_threshold: Minimum confidence to proceed (0.0-1.0)
+            research_agent_cls: Class used to create the Research Agent
+            analyst_agent_cls: Class used to create the Analyst Agent
+            strategy_agent_cls: Class used to create the Strategy Agent
         """
         if max_retries < 0:
             raise ValueError("max_retries must be non-negative")
@@ -73,17 +79,17 @@ class BossAgent:
         self.confidence_threshold = confidence_threshold
         
         # Initialize specialized agents with model router
-        self.research_agent = ResearchAgent(
+        self.research_agent = research_agent_cls(
             logger=logger,
             max_retries=max_retries,
             model_router=model_router
         )
-        self.analyst_agent = AnalystAgent(
+        self.analyst_agent = analyst_agent_cls(
             logger=logger,
             max_retries=max_retries,
             model_router=model_router
         )
-        self.strategy_agent = StrategyAgent(
+        self.strategy_agent = strategy_agent_cls(
             logger=logger,
             max_retries=max_retries,
             model_router=model_router
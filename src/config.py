@@ -8,7 +8,7 @@ twelve-factor app methodology.
 """
 
 import os
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -70,6 +70,25 @@ class Config:
     ESCALATION_WEBHOOK_ENABLED: bool = os.getenv("ESCALATION_WEBHOOK_ENABLED", "false").lower() == "true"
     ESCALATION_WEBHOOK_URL: str = os.getenv("ESCALATION_WEBHOOK_URL", "")
     
+    # Validation checks as (predicate, error message) pairs, evaluated in order
+    _VALIDATORS: List[Tuple[Callable[[type], bool], str]] = [
+        (
+            lambda cls: bool(cls.OPENROUTER_API_KEY),
+            "OPENROUTER_API_KEY is required. Please set it in your .env file or environment."
+        ),
+        (
+            lambda cls: not cls.ESCALATION_EMAIL_ENABLED
+            or bool(cls.ESCALATION_EMAIL_FROM and cls.ESCALATION_EMAIL_TO),
+            "Email escalation is enabled but email addresses are not configured. "
+            "Please set ESCALATION_EMAIL_FROM and ESCALATION_EMAIL_TO."
+        ),
+        (
+            lambda cls: not cls.ESCALATION_WEBHOOK_ENABLED or bool(cls.ESCALATION_WEBHOOK_URL),
+            "Webhook escalation is enabled but webhook URL is not configured. "
+            "Please set ESCALATION_WEBHOOK_URL."
+        ),
+    ]
+    
     @classmethod
     def validate(cls) -> None:
         """
@@ -78,24 +97,9 @@ class Config:
         Raises:
             ValueError: If required configuration values are missing.
         """
-        if not cls.OPENROUTER_API_KEY:
-            raise ValueError(
-                "OPENROUTER_API_KEY is required. Please set it in your .env file or environment."
-            )
-        
-        if cls.ESCALATION_EMAIL_ENABLED:
-            if not cls.ESCALATION_EMAIL_FROM or not cls.ESCALATION_EMAIL_TO:
-                raise ValueError(
-                    "Email escalation is enabled but email addresses are not configured. "
-                    "Please set ESCALATION_EMAIL_FROM and ESCALATION_EMAIL_TO."
-                )
-        
-        if cls.ESCALATION_WEBHOOK_ENABLED:
-            if not cls.ESCALATION_WEBHOOK_URL:
-                raise ValueError(
-                    "Webhook escalation is enabled but webhook URL is not configured. "
-                    "Please set ESCALATION_WEBHOOK_URL."
-                )
+        for check, error_message in cls._VALIDATORS:
+            if not check(cls):
+                raise ValueError(error_message)
     
     @classmethod
     def get_state_timeouts(cls) -> dict:
@@ -5,6 +5,7 @@ This module provides custom exception hierarchy, exponential backoff utilities,
 and error context logging for robust error handling throughout the system.
 """
 
+import random
 import time
 import traceback
 from typing import Dict, Any, Optional, Callable
@@ -144,14 +145,24 @@ class ExponentialBackoff:
     Exponential backoff calculator for retry logic
     
     Implements exponential backoff with jitter to prevent thundering herd problem.
+    
+    Strategies:
+    - "exponential": base_delay * exponential_base ** attempt, optionally
+      scaled to 50-100% by jitter
+    - "decorrelated": random between base_delay and 3x the previous delay,
+      which spreads competing clients apart faster under contention
     """
     
+    STRATEGIES = ("exponential", "decorrelated")
+    
     def __init__(
         self,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
-        jitter: bool = True
+        jitter: bool = True,
+        strategy: str = "exponential",
+        rng: Optional[random.Random] = None
     ):
         """
         Initialize exponential backoff
@@ -160,7 +171,9 @@ class ExponentialBackoff:
             base_delay: Initial delay in seconds
             max_delay: Maximum delay in seconds
             exponential_base: Base for exponential calculation
-            jitter: Whether to add random jitter
+            jitter: Whether to add random jitter (exponential strategy only)
+            strategy: Delay strategy, "exponential" or "decorrelated"
+            rng: Random number generator (defaults to the random module)
         """
         if base_delay <= 0:
             raise ValueError("base_delay must be positive")
@@ -168,11 +181,16 @@ class ExponentialBackoff:
             raise ValueError("max_delay must be >= base_delay")
         if exponential_base <= 1:
             raise ValueError("exponential_base must be > 1")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"strategy must be one of {self.STRATEGIES}")
         
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.strategy = strategy
+        self.rng = rng or random
+        self._prev_delay = base_delay
     
     def calculate_delay(self, attempt: int) -> float:
         """
@@ -187,6 +205,17 @@ class ExponentialBackoff:
         if attempt < 0:
             raise ValueError("attempt must be non-negative")
         
+        if self.strategy == "decorrelated":
+            # Attempt 0 starts a new retry sequence
+            if attempt == 0:
+                self._prev_delay = self.base_delay
+            delay = min(
+                self.max_delay,
+                self.rng.uniform(self.base_delay, self._prev_delay * 3)
+            )
+            self._prev_delay = delay
+            return delay
+        
         # Calculate exponential delay
         delay = self.base_delay * (self.exponential_base ** attempt)
         
@@ -195,8 +224,7 @@ class ExponentialBackoff:
         
         # Add jitter if enabled
         if self.jitter:
-            import random
-            delay = delay * (0.5 + random.random() * 0.5)  # 50-100% of calculated delay
+            delay = delay * (0.5 + self.rng.random() * 0.5)  # 50-100% of calculated delay
         
         return delay
     
@@ -291,21 +319,20 @@ class ErrorContext:
     
     def __enter__(self):
         """Enter context"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context and log if error occurred"""
         if exc_type is not None:
             # Error occurred
-            duration = time.time() - self.start_time
+            duration = time.monotonic() - self.start_time
             self.context["duration"] = duration
             self.context["error_type"] = exc_type.__name__
             self.context["error_message"] = str(exc_val)
             
             # Log error with context
             if self.logger:
-                import traceback
                 self.logger.log_error(
                     error_type=exc_type.__name__,
                     error_message=str(exc_val),
@@ -359,7 +386,6 @@ def handle_rate_limit(
     except RateLimitError as e:
         # All retries exhausted
         if logger:
-            import traceback
             logger.log_error(
                 error_type="RateLimitExhausted",
                 error_message=f"Rate limit for {service} exceeded after {max_retries} retries",
@@ -391,7 +417,6 @@ def safe_execute(
         return func()
     except Exception as e:
         if logger:
-            import traceback
             logger.log_error(
                 error_type=type(e).__name__,
                 error_message=str(e),
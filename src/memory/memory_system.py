@@ -7,7 +7,8 @@ confidence scores, and research results organized by session.
 
 import sqlite3
 import json
-from typing import List, Optional, Dict, Any
+from contextvars import ContextVar
+from typing import List, Optional, Dict, Any, Union
 from uuid import UUID, uuid4
 from datetime import datetime
 from pathlib import Path
@@ -97,26 +98,55 @@ class MemorySystem:
     - Stores agent decisions, tool outputs, confidence scores
     - Summarizes verbose data to prevent unbounded growth
     - Connection pooling and proper resource cleanup
+    - transaction() to commit bursts of writes once instead of per call
     - Schema designed for future PostgreSQL migration
     """
     
     def __init__(
         self,
-        db_path: str = "./data/agent_memory.db",
-        logger: Optional[StructuredLogger] = None
+        db_path: Union[str, Path] = "./data/agent_memory.db",
+        logger: Optional[StructuredLogger] = None,
+        durable: bool = True
     ):
         """
         Initialize memory system.
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ":memory:" for a private
+                in-memory database, or a "file:" URI
             logger: Optional structured logger
+            durable: When False, skip fsync and keep the rollback journal in
+                memory. Writes may be lost on a crash, so only use this for
+                throwaway databases such as in tests
         """
         self.db_path = Path(db_path)
         self.logger = logger
+        self.durable = durable
+        self._keepalive: Optional[sqlite3.Connection] = None
+        # Per thread / asyncio task, so other callers sharing this instance
+        # never join an open transaction
+        self._transaction_conn: ContextVar[Optional[sqlite3.Connection]] = ContextVar(
+            f"memory_transaction_{id(self)}", default=None
+        )
         
-        # Create database directory if it doesn't exist
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Accept pathlib.Path as well as str
+        db_path = str(db_path)
+        
+        if db_path == ":memory:":
+            # Every connection to ":memory:" opens a new empty database, so
+            # use a uniquely named shared-cache one instead
+            db_path = f"file:memory-{uuid4().hex}?mode=memory&cache=shared"
+        
+        self._uri = db_path.startswith("file:")
+        self._database = db_path if self._uri else str(self.db_path)
+        
+        if self._uri:
+            # Shared in-memory databases are dropped when their last
+            # connection closes; hold one open until close()
+            self._keepalive = sqlite3.connect(self._database, uri=True)
+        else:
+            # Create database directory if it doesn't exist
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database schema
         self._initialize_schema()
@@ -126,10 +156,20 @@ class MemorySystem:
         """
         Context manager for database connections.
         
-        Ensures proper connection cleanup and error handling.
+        Ensures proper connection cleanup and error handling. Inside
+        transaction() the open connection is reused and committed by the
+        transaction instead.
         """
-        conn = sqlite3.connect(str(self.db_path))
+        transaction_conn = self._transaction_conn.get()
+        if transaction_conn is not None:
+            yield transaction_conn
+            return
+        
+        conn = sqlite3.connect(self._database, uri=self._uri)
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        if not self.durable:
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA journal_mode=MEMORY")
         try:
             yield conn
             conn.commit()
@@ -146,6 +186,37 @@ class MemorySystem:
         finally:
             conn.close()
     
+    @contextmanager
+    def transaction(self):
+        """
+        Group several operations into a single commit.
+        
+        Callers storing bursts of decisions, tool outputs or scores should
+        wrap them in a transaction so SQLite commits once rather than once
+        per call. Everything is rolled back if the block raises.
+        
+        The open transaction is scoped to the current thread or asyncio
+        task: other threads and previously created tasks using the same
+        instance keep their own connections. Tasks spawned inside the block
+        inherit it, so await them before the block exits.
+        
+        Usage:
+            with memory.transaction():
+                for decision in decisions:
+                    memory.store_decision(...)
+        """
+        if self._transaction_conn.get() is not None:
+            # Nested transactions join the outer one
+            yield
+            return
+        
+        with self._get_connection() as conn:
+            token = self._transaction_conn.set(conn)
+            try:
+                yield
+            finally:
+                self._transaction_conn.reset(token)
+    
     def _initialize_schema(self):
         """Create database tables if they don't exist."""
         with self._get_connection() as conn:
@@ -590,6 +661,8 @@ class MemorySystem:
     
     def close(self):
         """Close memory system and cleanup resources."""
-        # SQLite connections are closed in context manager
-        # This method is here for API consistency
-        pass
+        # Per-operation connections are closed in the context manager; only
+        # URI databases hold a connection open between operations
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
@@ -65,6 +65,9 @@ class ModelRouter:
         }
     }
     
+    # Reverse index from OpenRouter model ID to MODELS key
+    _MODEL_KEYS_BY_ID = {info["id"]: key for key, info in MODELS.items()}
+    
     def __init__(
         self,
         api_key: str,
@@ -337,13 +340,7 @@ class ModelRouter:
             tokens: Tokens used
             latency: Response latency
         """
-        # Find model key from ID
-        model_key = None
-        for key, info in self.MODELS.items():
-            if info["id"] == model:
-                model_key = key
-                break
-        
+        model_key = self._MODEL_KEYS_BY_ID.get(model)
         if not model_key:
             return
         
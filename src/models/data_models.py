@@ -3,16 +3,42 @@ Core data models and type definitions for the autonomous research agent system.
 
 This module defines all data structures used throughout the system with proper
 type hints, validation methods, and serialization support.
+
+Construction never validates; callers handling untrusted data call validate()
+explicitly, so trusted data can be built without paying for checks.
 """
 
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from uuid import UUID, uuid4
 import json
+import os
+import re
 from enum import Enum
 
 
+# Canonical 8-4-4-4-12 hex UUID string, as produced by _new_session_id()
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE
+)
+
+
+def _new_session_id() -> str:
+    """
+    Generate a random version-4 UUID string.
+    
+    Formats os.urandom bytes directly instead of going through uuid.UUID,
+    setting the version and variant nibbles so the result is still a valid
+    RFC 4122 UUID4.
+    """
+    h = os.urandom(16).hex()
+    return (
+        f"{h[:8]}-{h[8:12]}-4{h[13:16]}-"
+        f"{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+    )
+
+
 class AgentType(Enum):
     """Types of specialized agents in the system."""
     RESEARCH = "research"
@@ -28,7 +54,15 @@ class DecisionType(Enum):
     ESCALATE = "escalate"
 
 
-@dataclass
+# Valid enum values for O(1) membership checks in validate()
+_VALID_AGENT_TYPES = frozenset(agent_type.value for agent_type in AgentType)
+_VALID_DECISIONS = frozenset(decision.value for decision in DecisionType)
+
+# Keys every ResearchResult.confidence_scores entry must provide
+_CONFIDENCE_SCORE_KEYS = frozenset({"self", "boss"})
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a task to be executed by an agent.
@@ -55,14 +89,14 @@ class Task:
         """
         if not self.task_id or not self.description:
             return False
-        if self.agent_type not in [e.value for e in AgentType]:
+        if self.agent_type not in _VALID_AGENT_TYPES:
             return False
         if self.priority < 1:
             return False
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     """
     Output from a specialized agent after task execution.
@@ -100,7 +134,7 @@ class AgentOutput:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """
     Boss Agent's evaluation of a specialized agent's output.
@@ -125,14 +159,14 @@ class EvaluationResult:
         """
         if not 0 <= self.boss_confidence <= 100:
             return False
-        if self.decision not in [e.value for e in DecisionType]:
+        if self.decision not in _VALID_DECISIONS:
             return False
         if not self.reasoning:
             return False
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     Result from a web search operation.
@@ -152,10 +186,16 @@ class SearchResult:
     
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "title": self.title,
+            "url": self.url,
+            "snippet": self.snippet,
+            "source": self.source,
+            "timestamp": self.timestamp
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
     """
     Response from an LLM model call.
@@ -193,7 +233,7 @@ class ModelResponse:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """
     Result from a tool execution.
@@ -223,7 +263,7 @@ class ToolResult:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchResult:
     """
     Final output from a complete research session.
@@ -283,7 +323,7 @@ class ResearchResult:
             New ResearchResult instance
         """
         return cls(
-            session_id=str(uuid4()),
+            session_id=_new_session_id(),
             goal=goal,
             timestamp=datetime.utcnow().isoformat() + "Z",
             agents_involved=agents_involved,
@@ -304,6 +344,19 @@ class ResearchResult:
         """
         return json.dumps(self.to_dict(), indent=2)
     
+    @classmethod
+    def from_json(cls, data: str) -> "ResearchResult":
+        """
+        Deserialize from a JSON string produced by to_json.
+        
+        Args:
+            data: JSON string representation
+            
+        Returns:
+            ResearchResult instance (not validated; call validate() if needed)
+        """
+        return cls(**json.loads(data))
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary.
@@ -323,10 +376,8 @@ class ResearchResult:
         Returns:
             True if result is valid, False otherwise
         """
-        # Validate session_id is UUID format
-        try:
-            UUID(self.session_id)
-        except (ValueError, AttributeError):
+        # Validate session_id is canonical UUID format
+        if not isinstance(self.session_id, str) or not _UUID_RE.fullmatch(self.session_id):
             return False
         
         # Validate required fields are present and non-empty
@@ -338,18 +389,18 @@ class ResearchResult:
         
         # Validate timestamp is ISO 8601 format
         try:
-            datetime.fromisoformat(self.timestamp.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
+            datetime.fromisoformat(self.timestamp)
+        except (ValueError, AttributeError, TypeError):
             return False
         
         # Validate confidence scores
-        for agent, scores in self.confidence_scores.items():
-            if 'self' not in scores or 'boss' not in scores:
-                return False
-            if not 0 <= scores['self'] <= 100:
-                return False
-            if not 0 <= scores['boss'] <= 100:
-                return False
+        if not all(
+            _CONFIDENCE_SCORE_KEYS <= scores.keys()
+            and 0 <= scores['self'] <= 100
+            and 0 <= scores['boss'] <= 100
+            for scores in self.confidence_scores.values()
+        ):
+            return False
         
         # Validate overall confidence
         if not 0 <= self.overall_confidence <= 100:
@@ -5,11 +5,13 @@ This module provides JSON-formatted logging with multiple levels, session isolat
 and comprehensive tracking of agent decisions, state transitions, tool calls, and errors.
 """
 
+import copy
 import logging
 import json
 import os
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from enum import Enum
 from pathlib import Path
 
@@ -32,45 +34,59 @@ class StructuredLogger:
     - Multiple log levels with filtering
     - Structured event types for different operations
     - Console and file output support
+    - In-memory sink for tests and embedding without disk I/O
+    - Ring buffer of recent events for cheap inspection
     - Log rotation to prevent unbounded disk usage
     """
     
     def __init__(
         self,
         session_id: str,
-        log_dir: str = "./logs",
+        log_dir: Optional[str] = "./logs",
         console_output: bool = True,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        sink: Optional[List[Dict[str, Any]]] = None,
+        recent_events_limit: int = 100
     ):
         """
         Initialize structured logger for a session.
         
         Args:
             session_id: Unique session identifier
-            log_dir: Directory for log files
+            log_dir: Directory for log files, or None to skip file output
             console_output: Whether to output to console
             log_level: Minimum log level (DEBUG, INFO, WARNING, ERROR)
+            sink: Optional list that receives each log entry as a dictionary
+            recent_events_limit: Number of recent entries kept in memory
         """
         self.session_id = session_id
-        self.log_dir = Path(log_dir)
         self.console_output = console_output
         self.log_level = LogLevel[log_level.upper()]
         
-        # Create log directory if it doesn't exist
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create session-specific log file
-        self.log_file = self.log_dir / f"session_{session_id}.json"
+        self.sink = sink
+        self._recent_events = deque(maxlen=recent_events_limit)
         
         # Initialize Python logger
         self.logger = logging.getLogger(f"session_{session_id}")
         self.logger.setLevel(logging.DEBUG)
         self.logger.handlers.clear()
         
-        # File handler for JSON logs
-        file_handler = logging.FileHandler(self.log_file, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
+        if log_dir is not None:
+            self.log_dir = Path(log_dir)
+            
+            # Create log directory if it doesn't exist
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Create session-specific log file
+            self.log_file = self.log_dir / f"session_{session_id}.json"
+            
+            # File handler for JSON logs
+            file_handler = logging.FileHandler(self.log_file, mode='a', encoding='utf-8')
+            file_handler.setLevel(logging.DEBUG)
+            self.logger.addHandler(file_handler)
+        else:
+            self.log_dir = None
+            self.log_file = None
         
         # Console handler if enabled
         if console_output:
@@ -124,9 +140,18 @@ class StructuredLogger:
             "level": level.value,
             "event_type": event_type,
             "message": message,
-            "data": data or {}
+            # Deep copy so later changes to the caller's data, including
+            # nested dicts and lists, don't rewrite history
+            "data": copy.deepcopy(data) if data else {}
         }
         
+        self._recent_events.append(log_entry)
+        if self.sink is not None:
+            self.sink.append(log_entry)
+        
+        if not self.logger.handlers:
+            return
+        
         # Write as JSON line
         log_line = json.dumps(log_entry)
         
@@ -397,6 +422,15 @@ class StructuredLogger:
         """Log error level message (simplified version)."""
         self._log(LogLevel.ERROR, "error", message, data)
     
+    def recent_events(self) -> list:
+        """
+        Get the most recent log entries without reading the log file.
+        
+        Returns:
+            List of up to recent_events_limit log entries, oldest first
+        """
+        return list(self._recent_events)
+    
     def close(self):
         """Close logger and cleanup handlers."""
         for handler in self.logger.handlers[:]:
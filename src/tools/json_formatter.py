@@ -5,13 +5,102 @@ This tool provides JSON formatting and schema validation capabilities.
 """
 
 import json
+import re
+import uuid
+from enum import Enum
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base_tool import BaseTool
 from models.data_models import ToolResult
 from structured_logging import StructuredLogger
 
 
+# orjson formats floats differently from repr() ("0.00001" vs "1e-05") and
+# writes NaN/Infinity as null, so output containing a float literal or null
+# is re-encoded with json.dumps
+_ORJSON_DRIFT_RE = re.compile(r"null|\d[.e]")
+
+# Compact json.dumps output is ASCII-only (DEL included), orjson's is UTF-8
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7e]")
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the non-JSON types orjson handles natively, for parity."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(data: Any, indent: int, minify: bool) -> Optional[str]:
+    """
+    Serialize data with orjson, if its output matches json.dumps.
+    
+    Args:
+        data: Data to serialize
+        indent: Indentation spaces
+        minify: Whether to produce compact output
+        
+    Returns:
+        JSON string, or None when the standard library must be used
+    """
+    if orjson is None or not (minify or indent == 2):
+        return None
+    
+    # Passthrough types and non-str keys raise, leaving them to json.dumps
+    option = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+    if not minify:
+        option |= orjson.OPT_INDENT_2
+    try:
+        # JSONEncodeError subclasses TypeError; also covers ints over 64 bits
+        json_string = orjson.dumps(data, option=option).decode("utf-8")
+    except TypeError:
+        return None
+    
+    if _ORJSON_DRIFT_RE.search(json_string):
+        return None
+    if minify and _NON_ASCII_RE.search(json_string):
+        return None
+    return json_string
+
+
+def _dumps(data: Any, indent: int, minify: bool) -> str:
+    """
+    Serialize data to a JSON string.
+    
+    Uses orjson when installed and its output is identical to the standard
+    library's, so results never depend on which encoder ran.
+    
+    Args:
+        data: Data to serialize
+        indent: Indentation spaces
+        minify: Whether to produce compact output
+        
+    Returns:
+        JSON string
+        
+    Raises:
+        TypeError: If data is not JSON serializable
+    """
+    json_string = _orjson_dumps(data, indent, minify)
+    if json_string is not None:
+        return json_string
+    
+    if minify:
+        return json.dumps(data, separators=(',', ':'), default=_json_default)
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=_json_default)
+
+
 class JSONFormatterTool(BaseTool):
     """
     JSON formatter with schema validation.
@@ -147,10 +236,7 @@ class JSONFormatterTool(BaseTool):
                     )
             
             # Format JSON
-            if minify:
-                json_string = json.dumps(data, separators=(',', ':'))
-            else:
-                json_string = json.dumps(data, indent=indent, ensure_ascii=False)
+            json_string = _dumps(data, indent, minify)
             
             if self.logger:
                 self.logger.log_info(
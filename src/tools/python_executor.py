@@ -7,6 +7,8 @@ This tool provides safe Python code execution with timeout and import restrictio
 import sys
 import io
 import time
+from functools import lru_cache
+from types import CodeType
 from typing import Optional, List, Dict, Any
 from contextlib import redirect_stdout, redirect_stderr
 
@@ -15,6 +17,24 @@ from models.data_models import ToolResult
 from structured_logging import StructuredLogger
 
 
+@lru_cache(maxsize=256)
+def _compile(code: str, mode: str) -> CodeType:
+    """
+    Compile code once and reuse the code object for repeated snippets.
+    
+    Args:
+        code: Python source to compile
+        mode: Compilation mode ("eval" or "exec")
+        
+    Returns:
+        Compiled code object
+        
+    Raises:
+        SyntaxError: If code is not valid in the given mode
+    """
+    return compile(code, "<string>", mode)
+
+
 class PythonExecutorTool(BaseTool):
     """
     Python executor with safety constraints.
@@ -163,10 +183,15 @@ class PythonExecutorTool(BaseTool):
             with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
                 # Try to evaluate as expression first
                 try:
-                    result_value = eval(code, exec_globals)
+                    compiled = _compile(code, "eval")
                 except SyntaxError:
+                    compiled = None
+                
+                if compiled is not None:
+                    result_value = eval(compiled, exec_globals)
+                else:
                     # If not an expression, execute as statements
-                    exec(code, exec_globals)
+                    exec(_compile(code, "exec"), exec_globals)
                     # Try to get 'result' variable if defined
                     result_value = exec_globals.get('result', None)
         
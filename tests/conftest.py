@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import os
+
+import pytest
+from hypothesis import settings
+
+from models.data_models import AgentOutput
+
+
+# Hypothesis profiles: "default" keeps Hypothesis' example count, "fast" trims
+# it for quick local iteration and "nightly" explores more inputs. Select with
+# HYPOTHESIS_PROFILE=fast or HYPOTHESIS_PROFILE=nightly.
+settings.register_profile("default", deadline=None)
+settings.register_profile("fast", max_examples=10, deadline=None)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+
+@pytest.fixture(scope="session")
+def make_output():
+    """
+    Factory for AgentOutput instances with sensible defaults.
+
+    Keyword arguments override the defaults, so tests only spell out the
+    fields they assert on.
+    """
+    def _make_output(**overrides) -> AgentOutput:
+        fields = {
+            "agent_name": "research_agent",
+            "task_id": "task_001",
+            "results": {},
+            "self_confidence": 75,
+            "reasoning": "Test",
+            "sources": [],
+            "execution_time": 1.0,
+        }
+        fields.update(overrides)
+        return AgentOutput(**fields)
+
+    return _make_output
@@ -37,14 +37,9 @@ class TestFullWorkflow:
             os.unlink(db_path)
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path):
         """Create temporary log directory"""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        # Cleanup
-        import shutil
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
+        return str(tmp_path)
     
     @pytest.fixture
     def boss_agent(self, temp_db, temp_log_dir):
@@ -56,7 +51,7 @@ class TestFullWorkflow:
             session_id="test-integration",
             log_dir=temp_log_dir
         )
-        memory = MemorySystem(db_path=temp_db, logger=logger)
+        memory = MemorySystem(db_path=temp_db, logger=logger, durable=False)
         
         # Create ModelRouter with test API key
         api_key = os.getenv("OPENROUTER_API_KEY", "test-key")
@@ -199,7 +194,7 @@ class TestFullWorkflow:
     def test_memory_system_uuid_handling(self, temp_db, temp_log_dir):
         """Test that memory system handles UUIDs correctly"""
         logger = StructuredLogger(session_id="test-uuid", log_dir=temp_log_dir)
-        memory = MemorySystem(db_path=temp_db, logger=logger)
+        memory = MemorySystem(db_path=temp_db, logger=logger, durable=False)
         
         # Create session
         session_id = memory.create_session("Test goal")
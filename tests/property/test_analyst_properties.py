@@ -0,0 +1,27 @@
+"""
+Property-based tests for Analyst Agent confidence estimation
+"""
+
+import pytest
+from hypothesis import given, strategies as st
+
+from agents.analyst_agent import AnalystAgent
+
+
+pytestmark = pytest.mark.property
+
+_AGENT = AnalystAgent()
+
+
+@given(
+    insight_count=st.integers(min_value=1, max_value=5),
+    pattern_count=st.integers(min_value=1, max_value=5)
+)
+def test_estimate_initial_confidence_bounds(insight_count, pattern_count):
+    """Confidence with any insights and patterns is above the no-data floor"""
+    insights = [{"type": "test", "insight": "Test", "recommendation": "Test"}] * insight_count
+    patterns = [{"type": "test", "description": "Pattern"}] * pattern_count
+    
+    confidence = _AGENT._estimate_initial_confidence(insights, patterns)
+    
+    assert 20 < confidence <= 100
@@ -6,13 +6,13 @@ and JSON formatting with validation.
 """
 
 import pytest
-import tempfile
-import shutil
 import json
+import uuid
 from pathlib import Path
 
 from tools.python_executor import PythonExecutorTool
 from tools.file_writer import FileWriterTool
+from tools import json_formatter
 from tools.json_formatter import JSONFormatterTool
 
 
@@ -31,23 +31,17 @@ class TestPythonExecutorTool:
         assert "math" in tool.allowed_imports
         assert "json" in tool.allowed_imports
     
-    def test_validate_input_success(self, executor):
-        """Test input validation with valid inputs."""
-        assert executor.validate_input(code="print('hello')") is True
-        assert executor.validate_input(code="x = 1 + 1", context={}) is True
-    
-    def test_validate_input_missing_code(self, executor):
-        """Test input validation fails without code."""
-        assert executor.validate_input(context={}) is False
-    
-    def test_validate_input_empty_code(self, executor):
-        """Test input validation fails with empty code."""
-        assert executor.validate_input(code="") is False
-        assert executor.validate_input(code="   ") is False
-    
-    def test_validate_input_invalid_context(self, executor):
-        """Test input validation fails with invalid context."""
-        assert executor.validate_input(code="x = 1", context="not a dict") is False
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({"code": "print('hello')"}, True),
+        ({"code": "x = 1 + 1", "context": {}}, True),
+        ({"context": {}}, False),
+        ({"code": ""}, False),
+        ({"code": "   "}, False),
+        ({"code": "x = 1", "context": "not a dict"}, False),
+    ], ids=["valid", "with_context", "missing_code", "empty_code", "blank_code", "invalid_context"])
+    def test_validate_input(self, executor, kwargs, expected):
+        """Test input validation for valid and invalid inputs."""
+        assert executor.validate_input(**kwargs) is expected
     
     def test_execute_simple_expression(self, executor):
         """Test executing simple expression."""
@@ -149,11 +143,9 @@ class TestFileWriterTool:
     """Tests for FileWriterTool."""
     
     @pytest.fixture
-    def temp_output_dir(self):
-        """Create temporary output directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    def temp_output_dir(self, tmp_path):
+        """Create a temporary output directory for each test."""
+        return str(tmp_path)
     
     @pytest.fixture
     def writer(self, temp_output_dir):
@@ -166,92 +158,49 @@ class TestFileWriterTool:
         assert tool.output_dir == Path(temp_output_dir)
         assert tool.output_dir.exists()
     
-    def test_validate_input_success(self, writer):
-        """Test input validation with valid inputs."""
-        assert writer.validate_input(filename="test.txt", content="Hello") is True
-        assert writer.validate_input(
-            filename="test",
-            content="Hello",
-            format="json"
-        ) is True
-    
-    def test_validate_input_missing_params(self, writer):
-        """Test input validation fails with missing parameters."""
-        assert writer.validate_input(filename="test.txt") is False
-        assert writer.validate_input(content="Hello") is False
-    
-    def test_validate_input_empty_filename(self, writer):
-        """Test input validation fails with empty filename."""
-        assert writer.validate_input(filename="", content="Hello") is False
-        assert writer.validate_input(filename="   ", content="Hello") is False
-    
-    def test_validate_input_path_traversal(self, writer):
-        """Test input validation prevents path traversal."""
-        assert writer.validate_input(filename="../test.txt", content="Hello") is False
-        assert writer.validate_input(filename="/etc/passwd", content="Hello") is False
-    
-    def test_validate_input_invalid_format(self, writer):
-        """Test input validation fails with invalid format."""
-        assert writer.validate_input(
-            filename="test",
-            content="Hello",
-            format="invalid"
-        ) is False
-    
-    def test_write_text_file(self, writer, temp_output_dir):
-        """Test writing text file."""
-        result = writer.execute(
-            filename="test.txt",
-            content="Hello, World!",
-            format="txt"
-        )
-        
-        assert result.success is True
-        assert result.data["filename"] == "test.txt"
-        assert result.data["format"] == "txt"
-        
-        # Verify file exists and content
-        file_path = Path(temp_output_dir) / "test.txt"
-        assert file_path.exists()
-        assert file_path.read_text() == "Hello, World!"
-    
-    def test_write_json_file(self, writer, temp_output_dir):
-        """Test writing JSON file."""
-        json_content = json.dumps({"key": "value", "number": 42})
-        
-        result = writer.execute(
-            filename="test.json",
-            content=json_content,
-            format="json"
-        )
-        
-        assert result.success is True
-        assert result.data["format"] == "json"
-        
-        # Verify file exists and content
-        file_path = Path(temp_output_dir) / "test.json"
-        assert file_path.exists()
-        
-        data = json.loads(file_path.read_text())
-        assert data["key"] == "value"
-        assert data["number"] == 42
-    
-    def test_write_markdown_file(self, writer, temp_output_dir):
-        """Test writing markdown file."""
-        md_content = "# Heading\n\nParagraph text."
-        
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({"filename": "test.txt", "content": "Hello"}, True),
+        ({"filename": "test", "content": "Hello", "format": "json"}, True),
+        ({"filename": "test.txt"}, False),
+        ({"content": "Hello"}, False),
+        ({"filename": "", "content": "Hello"}, False),
+        ({"filename": "   ", "content": "Hello"}, False),
+        ({"filename": "../test.txt", "content": "Hello"}, False),
+        ({"filename": "/etc/passwd", "content": "Hello"}, False),
+        ({"filename": "test", "content": "Hello", "format": "invalid"}, False),
+    ], ids=[
+        "valid", "valid_with_format", "missing_content", "missing_filename",
+        "empty_filename", "blank_filename", "relative_traversal",
+        "absolute_path", "invalid_format",
+    ])
+    def test_validate_input(self, writer, kwargs, expected):
+        """Test input validation for valid inputs, missing params and path traversal."""
+        assert writer.validate_input(**kwargs) is expected
+    
+    @pytest.mark.parametrize("filename,content,file_format", [
+        ("test.txt", "Hello, World!", "txt"),
+        ("test.json", json.dumps({"key": "value", "number": 42}), "json"),
+        ("test.md", "# Heading\n\nParagraph text.", "md"),
+    ], ids=["txt", "json", "md"])
+    def test_write_file(self, writer, temp_output_dir, filename, content, file_format):
+        """Test writing text, JSON and markdown files."""
         result = writer.execute(
-            filename="test.md",
-            content=md_content,
-            format="md"
+            filename=filename,
+            content=content,
+            format=file_format
         )
         
         assert result.success is True
-        assert result.data["format"] == "md"
+        assert result.data["filename"] == filename
+        assert result.data["format"] == file_format
         
-        # Verify file exists
-        file_path = Path(temp_output_dir) / "test.md"
+        # Verify file exists and content (JSON is re-indented on write)
+        file_path = Path(temp_output_dir) / filename
         assert file_path.exists()
+        if file_format == "json":
+            assert json.loads(file_path.read_text()) == json.loads(content)
+        else:
+            assert file_path.read_text() == content
     
     def test_write_with_auto_extension(self, writer, temp_output_dir):
         """Test that extension is added automatically."""
@@ -336,19 +285,16 @@ class TestJSONFormatterTool:
         tool = JSONFormatterTool()
         assert tool is not None
     
-    def test_validate_input_success(self, formatter):
-        """Test input validation with valid inputs."""
-        assert formatter.validate_input(data={"key": "value"}) is True
-        assert formatter.validate_input(data=[1, 2, 3]) is True
-        assert formatter.validate_input(data="string") is True
-    
-    def test_validate_input_missing_data(self, formatter):
-        """Test input validation fails without data."""
-        assert formatter.validate_input(schema={}) is False
-    
-    def test_validate_input_invalid_schema(self, formatter):
-        """Test input validation fails with invalid schema."""
-        assert formatter.validate_input(data={}, schema="not a dict") is False
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({"data": {"key": "value"}}, True),
+        ({"data": [1, 2, 3]}, True),
+        ({"data": "string"}, True),
+        ({"schema": {}}, False),
+        ({"data": {}, "schema": "not a dict"}, False),
+    ], ids=["dict", "list", "string", "missing_data", "invalid_schema"])
+    def test_validate_input(self, formatter, kwargs, expected):
+        """Test input validation for valid and invalid inputs."""
+        assert formatter.validate_input(**kwargs) is expected
     
     def test_format_simple_dict(self, formatter):
         """Test formatting simple dictionary."""
@@ -458,3 +404,36 @@ class TestJSONFormatterTool:
         assert result.success is True
         assert "size" in result.data
         assert result.data["size"] > 0
+    
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"key": "value", "items": [1, 2, 3]},
+            {"big": 2**70},
+            {"nan": float("nan"), "inf": float("inf")},
+            {"small": 1e-05, "large": 1e16},
+            {"text": "caf\u00e9 \x7f"},
+            {1: "int key"},
+            {"id": uuid.UUID(int=1)},
+        ],
+        ids=["plain", "big-int", "non-finite", "float-format", "non-ascii", "int-key", "uuid"],
+    )
+    @pytest.mark.parametrize("options", [{"indent": 2}, {"minify": True}], ids=["indent", "minify"])
+    def test_orjson_matches_stdlib(self, formatter, monkeypatch, data, options):
+        """Test that the orjson and standard library paths give identical output."""
+        result = formatter.execute(data=data, **options)
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        stdlib_result = formatter.execute(data=data, **options)
+        
+        assert result.success is True
+        assert result.data["json"] == stdlib_result.data["json"]
+    
+    def test_indent_does_not_change_values(self, formatter):
+        """Test that big ints and NaN serialize the same at every indent."""
+        data = {"big": 2**70, "nan": float("nan")}
+        two = formatter.execute(data=data, indent=2)
+        four = formatter.execute(data=data, indent=4)
+        
+        assert two.success is True and four.success is True
+        assert two.data["json"].split() == four.data["json"].split()
+        assert "NaN" in two.data["json"]
@@ -7,8 +7,80 @@ from unittest.mock import Mock
 
 from agents.analyst_agent import AnalystAgent
 from agents.base_agent import AgentContext
-from models.data_models import AgentOutput
-from evaluation.reflection import ConfidenceScore, AgentType
+from evaluation.reflection import AgentType
+from structured_logging.structured_logger import StructuredLogger
+
+
+_ANALYST_TYPE = AgentType.ANALYST
+
+
+class _DecisionCountingLogger:
+    """Logger stub that counts log_decision calls without mock bookkeeping"""
+    
+    def __init__(self):
+        self.decision_count = 0
+    
+    def log_decision(self, *args, **kwargs):
+        self.decision_count += 1
+
+
+def _make_insights(count):
+    """Build a list of placeholder insights"""
+    return [
+        {"type": "test", "insight": f"Test {i}", "recommendation": "Test"}
+        for i in range(1, count + 1)
+    ]
+
+
+def _make_patterns(count):
+    """Build a list of placeholder patterns"""
+    return [
+        {"type": "test", "description": f"Pattern {i}"}
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture(scope="module")
+def analyst():
+    """Shared analyst agent for tests that do not need a logger"""
+    return AnalystAgent()
+
+
+@pytest.fixture(scope="class")
+def executed_output_with_research(analyst, make_output):
+    """Analyst output for a context holding one research output"""
+    research_output = make_output(
+        results={
+            "query": "test query",
+            "sources": [
+                {"url": "https://example.edu/1", "title": "Test 1"},
+                {"url": "https://example.com/2", "title": "Test 2"}
+            ],
+            "total_sources": 2
+        },
+        reasoning="Research completed",
+        sources=["https://example.edu/1", "https://example.com/2"],
+        execution_time=2.0
+    )
+
+    context = AgentContext(
+        task_id="task_002",
+        task_description="analyze research findings",
+        previous_outputs={"research_agent": research_output}
+    )
+
+    return analyst.execute(context)
+
+
+@pytest.fixture(scope="class")
+def executed_output_no_data(analyst):
+    """Analyst output for a context without previous outputs"""
+    context = AgentContext(
+        task_id="task_003",
+        task_description="analyze data"
+    )
+
+    return analyst.execute(context)
 
 
 class TestAnalystAgent:
@@ -23,7 +95,7 @@ class TestAnalystAgent:
         )
         
         assert agent.agent_name == "test_analyst"
-        assert agent.agent_type == AgentType.ANALYST
+        assert agent.agent_type == _ANALYST_TYPE
         assert agent.max_retries == 5
         assert agent.enable_code_execution is True
     
@@ -34,78 +106,47 @@ class TestAnalystAgent:
         assert agent.agent_name == "analyst_agent"
         assert agent.enable_code_execution is True
     
-    def test_execute_with_previous_outputs(self):
+    @pytest.mark.xdist_group("heavy")
+    def test_execute_with_previous_outputs(self, executed_output_with_research):
         """Test execution with previous agent outputs"""
-        agent = AnalystAgent()
+        output = executed_output_with_research
         
-        # Create mock previous output
-        research_output = AgentOutput(
-            agent_name="research_agent",
-            task_id="task_001",
-            results={
-                "query": "test query",
-                "sources": [
-                    {"url": "https://example.edu/1", "title": "Test 1"},
-                    {"url": "https://example.com/2", "title": "Test 2"}
-                ],
-                "total_sources": 2
-            },
-            self_confidence=75,
-            reasoning="Research completed",
-            sources=["https://example.edu/1", "https://example.com/2"],
-            execution_time=2.0
-        )
-        
-        context = AgentContext(
-            task_id="task_002",
-            task_description="analyze research findings",
-            previous_outputs={"research_agent": research_output}
-        )
-        
-        output = agent.execute(context)
-        
-        # Verify output
-        assert isinstance(output, AgentOutput)
         assert output.agent_name == "analyst_agent"
         assert output.task_id == "task_002"
         assert output.self_confidence > 0
-        
-        # Verify results structure
-        assert "analysis" in output.results
-        assert "patterns" in output.results
-        assert "insights" in output.results
-        assert "data_sources" in output.results
-        assert "research_agent" in output.results["data_sources"]
     
-    def test_execute_no_previous_outputs(self):
+    @pytest.mark.xdist_group("heavy")
+    def test_execute_results_structure(self, executed_output_with_research):
+        """Test results structure of execution with previous outputs"""
+        results = executed_output_with_research.results
+        
+        assert "analysis" in results
+        assert "patterns" in results
+        assert "insights" in results
+        assert "data_sources" in results
+        assert "research_agent" in results["data_sources"]
+    
+    @pytest.mark.xdist_group("heavy")
+    def test_execute_no_previous_outputs(self, executed_output_no_data):
         """Test execution with no previous outputs"""
-        agent = AnalystAgent()
-        context = AgentContext(
-            task_id="task_003",
-            task_description="analyze data",
-            previous_outputs={}
-        )
-        
-        output = agent.execute(context)
+        output = executed_output_no_data
+        results = output.results
         
         assert output.self_confidence == 20
-        assert "No data available" in output.results["analysis"]
-        assert len(output.results["insights"]) == 0
-        assert len(output.results["patterns"]) == 0
+        assert "No data available" in results["analysis"]
+        assert len(results["insights"]) == 0
+        assert len(results["patterns"]) == 0
     
-    def test_execute_with_logger(self):
+    @pytest.mark.xdist_group("heavy")
+    def test_execute_with_logger(self, make_output):
         """Test execution with logger"""
-        mock_logger = Mock()
-        agent = AnalystAgent(logger=mock_logger)
+        logger = _DecisionCountingLogger()
+        agent = AnalystAgent(logger=logger)
         
-        research_output = AgentOutput(
-            agent_name="research_agent",
+        research_output = make_output(
             task_id="task_004",
             results={"data": "test"},
-            self_confidence=70,
-            reasoning="Test",
-            sources=[],
-            execution_time=1.0
+            self_confidence=70
         )
         
         context = AgentContext(
@@ -114,15 +155,14 @@ class TestAnalystAgent:
             previous_outputs={"research_agent": research_output}
         )
         
-        output = agent.execute(context)
+        agent.execute(context)
         
         # Verify logger was called
-        assert mock_logger.log_decision.called
+        assert logger.decision_count > 0
     
-    def test_calculate_confidence(self):
+    def test_calculate_confidence(self, analyst, make_output):
         """Test confidence calculation"""
-        agent = AnalystAgent()
-        output = AgentOutput(
+        output = make_output(
             agent_name="analyst_agent",
             task_id="task_006",
             results={
@@ -134,60 +174,48 @@ class TestAnalystAgent:
                     {"type": "test", "description": "Test pattern"}
                 ]
             },
-            self_confidence=75,
             reasoning="Analysis completed with insights",
-            sources=[],
             execution_time=2.0
         )
         
-        score = agent.calculate_confidence(output)
+        score = analyst.calculate_confidence(output)
         
-        assert isinstance(score, ConfidenceScore)
-        assert score.agent_type == AgentType.ANALYST
+        assert score.agent_type == _ANALYST_TYPE
         assert 0.0 <= score.overall <= 1.0
         assert "insight_depth" in score.factors
         assert "consistency" in score.factors
     
-    def test_calculate_confidence_with_logger(self):
+    def test_calculate_confidence_with_logger(self, make_output):
         """Test confidence calculation with logger"""
-        mock_logger = Mock()
+        mock_logger = Mock(spec=StructuredLogger)
         agent = AnalystAgent(logger=mock_logger)
-        output = AgentOutput(
+        output = make_output(
             agent_name="analyst_agent",
             task_id="task_007",
-            results={},
-            self_confidence=75,
-            reasoning="Test",
-            sources=[],
             execution_time=2.0
         )
         
-        score = agent.calculate_confidence(output)
+        agent.calculate_confidence(output)
         
         # Agents no longer log confidence scores directly
         # Only BossAgent logs confidence scores after evaluation
         assert not mock_logger.log_confidence_scores.called
     
-    def test_extract_data_from_context(self):
+    def test_extract_data_from_context(self, analyst, make_output):
         """Test data extraction from context"""
-        agent = AnalystAgent()
-        
-        output1 = AgentOutput(
+        output1 = make_output(
             agent_name="agent1",
             task_id="task_008",
             results={"data": "test1"},
             self_confidence=80,
-            reasoning="Test1",
-            sources=["source1"],
-            execution_time=1.0
+            sources=["source1"]
         )
         
-        output2 = AgentOutput(
+        output2 = make_output(
             agent_name="agent2",
             task_id="task_009",
             results={"data": "test2"},
             self_confidence=70,
-            reasoning="Test2",
             sources=["source2"],
             execution_time=1.5
         )
@@ -201,7 +229,7 @@ class TestAnalystAgent:
             }
         )
         
-        data = agent._extract_data_from_context(context)
+        data = analyst._extract_data_from_context(context)
         
         assert len(data) == 2
         assert "agent1" in data
@@ -209,9 +237,8 @@ class TestAnalystAgent:
         assert data["agent1"]["confidence"] == 80
         assert data["agent2"]["confidence"] == 70
     
-    def test_perform_analysis(self):
+    def test_perform_analysis(self, analyst):
         """Test analysis performance"""
-        agent = AnalystAgent()
         data = {
             "research_agent": {
                 "results": {"query": "test", "total_sources": 5},
@@ -221,16 +248,15 @@ class TestAnalystAgent:
             }
         }
         
-        analysis = agent._perform_analysis("test task", data)
+        analysis = analyst._perform_analysis("test task", data)
         
         assert isinstance(analysis, str)
         assert "test task" in analysis
         assert "RESEARCH_AGENT" in analysis  # Agent name is uppercased in output
         assert "75%" in analysis
     
-    def test_identify_patterns(self):
+    def test_identify_patterns(self, analyst):
         """Test pattern identification"""
-        agent = AnalystAgent()
         data = {
             "research_agent": {
                 "results": {"data": "test"},
@@ -246,7 +272,7 @@ class TestAnalystAgent:
             }
         }
         
-        patterns = agent._identify_patterns(data, "test analysis")
+        patterns = analyst._identify_patterns(data, "test analysis")
         
         assert isinstance(patterns, list)
         assert len(patterns) > 0
@@ -259,9 +285,8 @@ class TestAnalystAgent:
         volume_patterns = [p for p in patterns if p["type"] == "data_volume_pattern"]
         assert len(volume_patterns) > 0
     
-    def test_identify_patterns_with_sources(self):
+    def test_identify_patterns_with_sources(self, analyst):
         """Test pattern identification with source reliability"""
-        agent = AnalystAgent()
         data = {
             "research_agent": {
                 "results": {},
@@ -275,7 +300,7 @@ class TestAnalystAgent:
             }
         }
         
-        patterns = agent._identify_patterns(data, "test")
+        patterns = analyst._identify_patterns(data, "test")
         
         # Should have source reliability pattern
         reliability_patterns = [p for p in patterns if p["type"] == "source_reliability_pattern"]
@@ -286,9 +311,8 @@ class TestAnalystAgent:
         assert pattern["details"]["total_sources"] == 3
         assert pattern["details"]["reliable_sources"] == 2  # .edu and .gov
     
-    def test_generate_insights(self):
+    def test_generate_insights(self, analyst):
         """Test insight generation"""
-        agent = AnalystAgent()
         data = {
             "research_agent": {
                 "results": {},
@@ -305,7 +329,7 @@ class TestAnalystAgent:
             }
         ]
         
-        insights = agent._generate_insights("test task", data, patterns)
+        insights = analyst._generate_insights("test task", data, patterns)
         
         assert isinstance(insights, list)
         assert len(insights) > 0
@@ -320,9 +344,8 @@ class TestAnalystAgent:
             assert "insight" in insight
             assert "recommendation" in insight
     
-    def test_generate_insights_high_confidence(self):
+    def test_generate_insights_high_confidence(self, analyst):
         """Test insight generation with high confidence data"""
-        agent = AnalystAgent()
         data = {
             "agent1": {"confidence": 85, "results": {}, "sources": [], "reasoning": "Test"},
             "agent2": {"confidence": 90, "results": {}, "sources": [], "reasoning": "Test"}
@@ -337,15 +360,14 @@ class TestAnalystAgent:
             }
         ]
         
-        insights = agent._generate_insights("test", data, patterns)
+        insights = analyst._generate_insights("test", data, patterns)
         
         # Should have confidence insight
         conf_insights = [i for i in insights if i["type"] == "confidence_insight"]
         assert len(conf_insights) > 0
     
-    def test_generate_insights_reliable_sources(self):
+    def test_generate_insights_reliable_sources(self, analyst):
         """Test insight generation with reliable sources"""
-        agent = AnalystAgent()
         data = {
             "research_agent": {
                 "confidence": 75,
@@ -365,103 +387,76 @@ class TestAnalystAgent:
             }
         ]
         
-        insights = agent._generate_insights("test", data, patterns)
+        insights = analyst._generate_insights("test", data, patterns)
         
         # Should have reliability insight
         rel_insights = [i for i in insights if i["type"] == "reliability_insight"]
         assert len(rel_insights) > 0
     
-    def test_get_quality_recommendation_high(self):
-        """Test quality recommendation for high confidence"""
-        agent = AnalystAgent()
-        recommendation = agent._get_quality_recommendation(80.0)
-        
-        assert "sufficient" in recommendation.lower()
-    
-    def test_get_quality_recommendation_moderate(self):
-        """Test quality recommendation for moderate confidence"""
-        agent = AnalystAgent()
-        recommendation = agent._get_quality_recommendation(60.0)
-        
-        assert "additional data" in recommendation.lower()
+    @pytest.mark.parametrize("confidence,expected", [
+        (80.0, "sufficient"),
+        (60.0, "additional data"),
+        (40.0, "replanning"),
+    ], ids=["high", "moderate", "low"])
+    def test_get_quality_recommendation(self, analyst, confidence, expected):
+        """Test quality recommendation for each confidence band"""
+        recommendation = analyst._get_quality_recommendation(confidence)
+        
+        assert expected in recommendation.lower()
     
-    def test_get_quality_recommendation_low(self):
-        """Test quality recommendation for low confidence"""
-        agent = AnalystAgent()
-        recommendation = agent._get_quality_recommendation(40.0)
-        
-        assert "replanning" in recommendation.lower()
-    
-    def test_estimate_initial_confidence_no_data(self):
-        """Test confidence estimation with no insights or patterns"""
-        agent = AnalystAgent()
-        confidence = agent._estimate_initial_confidence([], [])
-        
-        assert confidence == 20
+    @pytest.mark.parametrize(
+        "insight_count,pattern_count,min_confidence,max_confidence,reasoning_fragments",
+        [
+            (0, 0, 20, 20, ["Insufficient data"]),
+            (3, 2, 21, 100, ["2 patterns", "3 insights"]),
+            (1, 1, 21, 100, ["1 patterns", "1 insights"]),
+        ],
+        ids=["no_data", "with_data", "single_insight_and_pattern"]
+    )
+    def test_confidence_and_reasoning(
+        self,
+        analyst,
+        insight_count,
+        pattern_count,
+        min_confidence,
+        max_confidence,
+        reasoning_fragments
+    ):
+        """Test confidence estimation and reasoning for insight/pattern counts"""
+        insights = _make_insights(insight_count)
+        patterns = _make_patterns(pattern_count)
+        
+        confidence = analyst._estimate_initial_confidence(insights, patterns)
+        reasoning = analyst._generate_reasoning(insights, patterns)
+        
+        assert min_confidence <= confidence <= max_confidence
+        for fragment in reasoning_fragments:
+            assert fragment in reasoning
     
-    def test_estimate_initial_confidence_with_data(self):
-        """Test confidence estimation with insights and patterns"""
-        agent = AnalystAgent()
-        insights = [
-            {"type": "test", "insight": "Test 1", "recommendation": "Test"},
-            {"type": "test", "insight": "Test 2", "recommendation": "Test"},
-            {"type": "test", "insight": "Test 3", "recommendation": "Test"}
-        ]
-        patterns = [
-            {"type": "test", "description": "Pattern 1"},
-            {"type": "test", "description": "Pattern 2"}
-        ]
-        
-        confidence = agent._estimate_initial_confidence(insights, patterns)
-        
-        assert 20 < confidence <= 100
-    
-    def test_generate_reasoning_no_data(self):
-        """Test reasoning generation with no data"""
-        agent = AnalystAgent()
-        reasoning = agent._generate_reasoning([], [])
-        
-        assert "Insufficient data" in reasoning
-    
-    def test_generate_reasoning_with_data(self):
-        """Test reasoning generation with data"""
-        agent = AnalystAgent()
-        insights = [{"type": "test", "insight": "Test", "recommendation": "Test"}]
-        patterns = [{"type": "test", "description": "Test"}]
-        
-        reasoning = agent._generate_reasoning(insights, patterns)
-        
-        assert "1 patterns" in reasoning
-        assert "1 insights" in reasoning
-    
-    def test_execution_time_tracking(self):
+    def test_execution_time_tracking(self, analyst):
         """Test that execution time is tracked"""
-        agent = AnalystAgent()
         context = AgentContext(
             task_id="task_011",
-            task_description="test",
-            previous_outputs={}
+            task_description="test"
         )
         
-        output = agent.execute(context)
+        output = analyst.execute(context)
         
         assert output.execution_time > 0
     
-    def test_multiple_previous_outputs(self):
+    @pytest.mark.xdist_group("heavy")
+    def test_multiple_previous_outputs(self, analyst, make_output):
         """Test analysis with multiple previous agent outputs"""
-        agent = AnalystAgent()
-        
-        outputs = {}
-        for i in range(3):
-            outputs[f"agent_{i}"] = AgentOutput(
+        outputs = {
+            f"agent_{i}": make_output(
                 agent_name=f"agent_{i}",
                 task_id=f"task_{i}",
                 results={"data": f"test_{i}"},
                 self_confidence=70 + i * 5,
-                reasoning=f"Test {i}",
-                sources=[],
-                execution_time=1.0
+                reasoning=f"Test {i}"
             )
+            for i in range(3)
+        }
         
         context = AgentContext(
             task_id="task_012",
@@ -469,7 +464,7 @@ class TestAnalystAgent:
             previous_outputs=outputs
         )
         
-        output = agent.execute(context)
+        results = analyst.execute(context).results
         
-        assert len(output.results["data_sources"]) == 3
-        assert output.results["total_insights"] > 0
+        assert len(results["data_sources"]) == 3
+        assert results["total_insights"] > 0
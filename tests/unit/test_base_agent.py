@@ -2,19 +2,27 @@
 Unit tests for base agent interface
 """
 
+import re
+
 import pytest
 from agents.base_agent import BaseAgent, AgentContext
 from models.data_models import AgentOutput
 from evaluation.reflection import ConfidenceScore, AgentType
 
 
+_RESEARCH_TYPE = AgentType.RESEARCH
+_EXPECTED_REPR = "ConcreteAgent(name=test_agent, type=research, retries=1/3)"
+_EMPTY_NAME_RE = re.compile("agent_name cannot be empty")
+_NEGATIVE_RETRIES_RE = re.compile("max_retries must be non-negative")
+
+
 class ConcreteAgent(BaseAgent):
     """Concrete implementation of BaseAgent for testing"""
     
     def __init__(self, agent_name: str = "test_agent", max_retries: int = 3):
         super().__init__(
             agent_name=agent_name,
-            agent_type=AgentType.RESEARCH,
+            agent_type=_RESEARCH_TYPE,
             max_retries=max_retries
         )
         self.execute_called = False
@@ -44,6 +52,46 @@ class ConcreteAgent(BaseAgent):
         )
 
 
+@pytest.fixture
+def concrete_factory():
+    """Create ConcreteAgent instances and reset their retry counts afterwards"""
+    agents = []
+    
+    def _create(**kwargs):
+        agent = ConcreteAgent(**kwargs)
+        agents.append(agent)
+        return agent
+    
+    yield _create
+    
+    for agent in agents:
+        agent.reset_retry_count()
+
+
+@pytest.fixture(scope="class")
+def sample_context(make_output):
+    """Context with one previous output, shared by serialization tests"""
+    output = make_output(
+        agent_name="prev_agent",
+        task_id="task_000",
+        self_confidence=80
+    )
+    
+    return AgentContext(
+        task_id="task_001",
+        task_description="Test task",
+        previous_outputs={"prev": output},
+        retry_count=1,
+        session_id="session_123"
+    )
+
+
+@pytest.fixture(scope="class")
+def serialized_context(sample_context):
+    """Result of sample_context.to_dict(), computed once per class"""
+    return sample_context.to_dict()
+
+
 class TestAgentContext:
     """Tests for AgentContext dataclass"""
     
@@ -61,16 +109,12 @@ class TestAgentContext:
         assert context.session_id is None
         assert context.additional_context == {}
     
-    def test_agent_context_with_all_fields(self):
+    def test_agent_context_with_all_fields(self, make_output):
         """Test creating context with all fields"""
-        output = AgentOutput(
+        output = make_output(
             agent_name="prev_agent",
             task_id="task_000",
-            results={},
-            self_confidence=80,
-            reasoning="test",
-            sources=[],
-            execution_time=1.0
+            self_confidence=80
         )
         
         context = AgentContext(
@@ -88,34 +132,19 @@ class TestAgentContext:
         assert "prev" in context.previous_outputs
         assert context.additional_context["key"] == "value"
     
-    def test_agent_context_to_dict(self):
-        """Test serialization to dictionary"""
-        output = AgentOutput(
-            agent_name="prev_agent",
-            task_id="task_000",
-            results={},
-            self_confidence=80,
-            reasoning="test",
-            sources=[],
-            execution_time=1.0
-        )
-        
-        context = AgentContext(
-            task_id="task_001",
-            task_description="Test task",
-            previous_outputs={"prev": output},
-            retry_count=1,
-            session_id="session_123"
-        )
-        
-        data = context.to_dict()
+    def test_agent_context_to_dict(self, serialized_context):
+        """Test serialization of top-level fields to dictionary"""
+        assert serialized_context["task_id"] == "task_001"
+        assert serialized_context["task_description"] == "Test task"
+        assert serialized_context["retry_count"] == 1
+        assert serialized_context["session_id"] == "session_123"
+    
+    def test_agent_context_to_dict_previous_outputs(self, serialized_context):
+        """Test serialization of previous outputs to dictionary"""
+        previous_outputs = serialized_context["previous_outputs"]
         
-        assert data["task_id"] == "task_001"
-        assert data["task_description"] == "Test task"
-        assert data["retry_count"] == 1
-        assert data["session_id"] == "session_123"
-        assert "prev" in data["previous_outputs"]
-        assert data["previous_outputs"]["prev"]["agent_name"] == "prev_agent"
+        assert "prev" in previous_outputs
+        assert previous_outputs["prev"]["agent_name"] == "prev_agent"
 
 
 class TestBaseAgent:
@@ -126,18 +155,18 @@ class TestBaseAgent:
         agent = ConcreteAgent(agent_name="test_agent", max_retries=5)
         
         assert agent.agent_name == "test_agent"
-        assert agent.agent_type == AgentType.RESEARCH
+        assert agent.agent_type == _RESEARCH_TYPE
         assert agent.max_retries == 5
         assert agent.get_retry_count() == 0
     
     def test_agent_initialization_empty_name(self):
         """Test that empty agent name raises error"""
-        with pytest.raises(ValueError, match="agent_name cannot be empty"):
+        with pytest.raises(ValueError, match=_EMPTY_NAME_RE):
             ConcreteAgent(agent_name="")
     
     def test_agent_initialization_negative_retries(self):
         """Test that negative max_retries raises error"""
-        with pytest.raises(ValueError, match="max_retries must be non-negative"):
+        with pytest.raises(ValueError, match=_NEGATIVE_RETRIES_RE):
             ConcreteAgent(max_retries=-1)
     
     def test_execute_method_called(self):
@@ -151,32 +180,22 @@ class TestBaseAgent:
         output = agent.execute(context)
         
         assert agent.execute_called is True
-        assert isinstance(output, AgentOutput)
         assert output.agent_name == "test_agent"
         assert output.task_id == "task_001"
     
-    def test_calculate_confidence_method_called(self):
+    def test_calculate_confidence_method_called(self, make_output):
         """Test that calculate_confidence method is called"""
         agent = ConcreteAgent()
-        output = AgentOutput(
-            agent_name="test_agent",
-            task_id="task_001",
-            results={},
-            self_confidence=75,
-            reasoning="test",
-            sources=[],
-            execution_time=1.0
-        )
+        output = make_output(agent_name="test_agent")
         
         score = agent.calculate_confidence(output)
         
         assert agent.calculate_confidence_called is True
-        assert isinstance(score, ConfidenceScore)
         assert score.overall == 0.75
     
-    def test_increment_retry_count(self):
+    def test_increment_retry_count(self, concrete_factory):
         """Test incrementing retry count"""
-        agent = ConcreteAgent()
+        agent = concrete_factory()
         
         assert agent.get_retry_count() == 0
         
@@ -188,9 +207,9 @@ class TestBaseAgent:
         assert count == 2
         assert agent.get_retry_count() == 2
     
-    def test_reset_retry_count(self):
+    def test_reset_retry_count(self, concrete_factory):
         """Test resetting retry count"""
-        agent = ConcreteAgent()
+        agent = concrete_factory()
         
         agent.increment_retry_count()
         agent.increment_retry_count()
@@ -199,9 +218,9 @@ class TestBaseAgent:
         agent.reset_retry_count()
         assert agent.get_retry_count() == 0
     
-    def test_has_retries_remaining(self):
+    def test_has_retries_remaining(self, concrete_factory):
         """Test checking if retries are remaining"""
-        agent = ConcreteAgent(max_retries=3)
+        agent = concrete_factory(max_retries=3)
         
         assert agent.has_retries_remaining() is True
         
@@ -214,9 +233,9 @@ class TestBaseAgent:
         agent.increment_retry_count()
         assert agent.has_retries_remaining() is False
     
-    def test_can_retry(self):
+    def test_can_retry(self, concrete_factory):
         """Test can_retry method"""
-        agent = ConcreteAgent(max_retries=2)
+        agent = concrete_factory(max_retries=2)
         
         assert agent.can_retry() is True
         
@@ -245,12 +264,7 @@ class TestBaseAgent:
         agent = ConcreteAgent(agent_name="test_agent", max_retries=3)
         agent.increment_retry_count()
         
-        repr_str = repr(agent)
-        
-        assert "ConcreteAgent" in repr_str
-        assert "test_agent" in repr_str
-        assert "research" in repr_str
-        assert "1/3" in repr_str
+        assert repr(agent) == _EXPECTED_REPR
     
     def test_retry_count_tracking_across_executions(self):
         """Test that retry count persists across multiple executions"""
@@ -280,14 +294,14 @@ class TestBaseAgent:
         with pytest.raises(TypeError):
             BaseAgent(
                 agent_name="test",
-                agent_type=AgentType.RESEARCH,
+                agent_type=_RESEARCH_TYPE,
                 max_retries=3
             )
     
-    def test_multiple_agents_independent_retry_counts(self):
+    def test_multiple_agents_independent_retry_counts(self, concrete_factory):
         """Test that multiple agents have independent retry counts"""
-        agent1 = ConcreteAgent(agent_name="agent1")
-        agent2 = ConcreteAgent(agent_name="agent2")
+        agent1 = concrete_factory(agent_name="agent1")
+        agent2 = concrete_factory(agent_name="agent2")
         
         agent1.increment_retry_count()
         agent1.increment_retry_count()
@@ -295,33 +309,27 @@ class TestBaseAgent:
         assert agent1.get_retry_count() == 2
         assert agent2.get_retry_count() == 0
     
-    def test_agent_with_zero_max_retries(self):
+    def test_agent_with_zero_max_retries(self, concrete_factory):
         """Test agent with zero max retries"""
-        agent = ConcreteAgent(max_retries=0)
+        agent = concrete_factory(max_retries=0)
         
         assert agent.max_retries == 0
         assert agent.can_retry() is False
         assert agent.has_retries_remaining() is False
     
-    def test_context_with_multiple_previous_outputs(self):
+    def test_context_with_multiple_previous_outputs(self, make_output):
         """Test context with multiple previous agent outputs"""
-        output1 = AgentOutput(
+        output1 = make_output(
             agent_name="agent1",
-            task_id="task_001",
             results={"data": "1"},
-            self_confidence=80,
-            reasoning="test1",
-            sources=[],
-            execution_time=1.0
+            self_confidence=80
         )
         
-        output2 = AgentOutput(
+        output2 = make_output(
             agent_name="agent2",
             task_id="task_002",
             results={"data": "2"},
             self_confidence=85,
-            reasoning="test2",
-            sources=[],
             execution_time=2.0
         )
         
@@ -2,28 +2,198 @@
 Unit tests for Boss Agent
 """
 
+import re
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import List, Optional
 import uuid
 
 from boss_agent import BossAgent, WorkflowPhase
+from agents.research_agent import ResearchAgent
+from agents.analyst_agent import AnalystAgent
+from agents.strategy_agent import StrategyAgent
+from memory.memory_system import MemorySystem
+from structured_logging.structured_logger import StructuredLogger
 from models.data_models import AgentOutput, ResearchResult
 from evaluation.reflection import ConfidenceScore, AgentType
 
 
+_NEGATIVE_RETRIES_RE = re.compile("max_retries must be non-negative")
+_THRESHOLD_RANGE_RE = re.compile("confidence_threshold must be between")
+
+
+@dataclass(frozen=True)
+class _PhaseScenario:
+    """Inputs and expected outcome for a single _execute_phase run."""
+    confidences: List[int]
+    max_retries: int
+    confidence_threshold: float
+    expected_confidence: Optional[int]
+    expected_executions: int
+    expected_retries: int
+
+
+_PHASE_SCENARIOS = [
+    pytest.param(
+        _PhaseScenario([75], 3, 0.70, 75, 1, 0),
+        id="success"
+    ),
+    # 0.40 sits between min_acceptable (0.40) and the low threshold (0.50), so it replans
+    pytest.param(
+        _PhaseScenario([40, 80], 3, 0.70, 80, 2, 1),
+        id="low_confidence_retry"
+    ),
+    # 0.20 is below min_acceptable, so error recovery ends the phase immediately
+    pytest.param(
+        _PhaseScenario([20], 2, 0.50, None, 1, 0),
+        id="max_retries_exceeded"
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def mock_memory():
+    """Memory system mock shared across the module."""
+    return Mock(spec_set=MemorySystem)
+
+
+@pytest.fixture(scope="module")
+def mock_logger():
+    """Structured logger mock shared across the module."""
+    return Mock(spec_set=StructuredLogger)
+
+
+@pytest.fixture(scope="module")
+def mock_agents():
+    """Specialized agent mocks shared across the module, keyed by role."""
+    agents = {
+        "research": Mock(spec=ResearchAgent),
+        "analyst": Mock(spec=AnalystAgent),
+        "strategy": Mock(spec=StrategyAgent)
+    }
+    for role, agent in agents.items():
+        agent.agent_name = f"{role}_agent"
+    return agents
+
+
+@pytest.fixture(scope="module")
+def research_output():
+    """Research agent output shared across the module (read-only)."""
+    return AgentOutput(
+        agent_name="research_agent",
+        task_id="task_001",
+        results={"summary": "Research findings", "total_sources": 3},
+        self_confidence=75,
+        reasoning="Research completed",
+        sources=["https://example.com"],
+        execution_time=2.0
+    )
+
+
+@pytest.fixture(scope="module")
+def analyst_output():
+    """Analyst agent output shared across the module (read-only)."""
+    return AgentOutput(
+        agent_name="analyst_agent",
+        task_id="task_002",
+        results={"insights": [{"type": "test", "insight": "Test"}], "patterns": []},
+        self_confidence=80,
+        reasoning="Analysis completed",
+        sources=[],
+        execution_time=1.5
+    )
+
+
+@pytest.fixture(scope="module")
+def strategy_output():
+    """Strategy agent output shared across the module (read-only)."""
+    return AgentOutput(
+        agent_name="strategy_agent",
+        task_id="task_003",
+        results={"recommendations": [{"title": "Test"}], "action_plan": []},
+        self_confidence=85,
+        reasoning="Strategy completed",
+        sources=[],
+        execution_time=1.0
+    )
+
+
+@pytest.fixture(scope="module")
+def confidence_scores():
+    """Confidence scores matching the shared agent outputs, keyed by role."""
+    return {
+        "research": ConfidenceScore(0.75, {"test": 0.75}, AgentType.RESEARCH, "Test"),
+        "analyst": ConfidenceScore(0.80, {"test": 0.80}, AgentType.ANALYST, "Test"),
+        "strategy": ConfidenceScore(0.85, {"test": 0.85}, AgentType.STRATEGY, "Test")
+    }
+
+
+def _make_stub_agent(name, output, confidence):
+    """
+    Lightweight agent stand-in for tests that only read return values.
+    
+    Unlike Mock, it records no calls, so it is only suitable where call
+    counts and arguments are not asserted.
+    """
+    return SimpleNamespace(
+        agent_name=name,
+        execute=lambda context: output,
+        calculate_confidence=lambda agent_output: confidence,
+        increment_retry_count=lambda: None,
+        reset_retry_count=lambda: None
+    )
+
+
+def _agent_cls(agent):
+    """Stand-in agent class whose constructor returns the given agent."""
+    return lambda **kwargs: agent
+
+
+@pytest.fixture(scope="module")
+def agent_classes(mock_agents):
+    """BossAgent keyword arguments that inject the shared mock agents."""
+    return {
+        "research_agent_cls": _agent_cls(mock_agents["research"]),
+        "analyst_agent_cls": _agent_cls(mock_agents["analyst"]),
+        "strategy_agent_cls": _agent_cls(mock_agents["strategy"])
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_boss(mock_memory, mock_logger, agent_classes):
+    """BossAgent built once per module for tests that use default settings."""
+    return BossAgent(mock_memory, mock_logger, None, **agent_classes)
+
+
+@pytest.fixture
+def boss(shared_boss):
+    """Shared BossAgent whose workflow state is reset after each test."""
+    yield shared_boss
+    shared_boss.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_memory, mock_logger, mock_agents):
+    """Reset shared mocks so each test starts from a clean skeleton."""
+    for mock in (mock_memory, mock_logger, *mock_agents.values()):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_memory.create_session.return_value = "session_123"
+
+
 class TestBossAgent:
     """Tests for BossAgent"""
     
-    def test_initialization(self):
+    def test_initialization(self, mock_memory, mock_logger, mock_agents, agent_classes):
         """Test initializing boss agent"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
         boss = BossAgent(
             memory_system=mock_memory,
             logger=mock_logger,
+            model_router=None,
             max_retries=5,
-            confidence_threshold=0.60
+            confidence_threshold=0.60,
+            **agent_classes
         )
         
         assert boss.memory_system == mock_memory
@@ -32,103 +202,40 @@ class TestBossAgent:
         assert boss.confidence_threshold == 0.60
         assert boss.current_phase is None
         assert boss.active_agent is None
+        assert boss.research_agent is mock_agents["research"]
+        assert boss.analyst_agent is mock_agents["analyst"]
+        assert boss.strategy_agent is mock_agents["strategy"]
     
-    def test_initialization_invalid_retries(self):
+    def test_initialization_invalid_retries(self, mock_memory, mock_logger, agent_classes):
         """Test that invalid max_retries raises error"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        with pytest.raises(ValueError, match="max_retries must be non-negative"):
-            BossAgent(mock_memory, mock_logger, max_retries=-1)
+        with pytest.raises(ValueError, match=_NEGATIVE_RETRIES_RE):
+            BossAgent(mock_memory, mock_logger, None, max_retries=-1, **agent_classes)
     
-    def test_initialization_invalid_threshold(self):
+    def test_initialization_invalid_threshold(self, mock_memory, mock_logger, agent_classes):
         """Test that invalid confidence_threshold raises error"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        with pytest.raises(ValueError, match="confidence_threshold must be between"):
-            BossAgent(mock_memory, mock_logger, confidence_threshold=1.5)
+        with pytest.raises(ValueError, match=_THRESHOLD_RANGE_RE):
+            BossAgent(mock_memory, mock_logger, None, confidence_threshold=1.5, **agent_classes)
     
-    @patch('boss_agent.ResearchAgent')
-    @patch('boss_agent.AnalystAgent')
-    @patch('boss_agent.StrategyAgent')
-    def test_execute_research_success(self, mock_strategy_class, mock_analyst_class, mock_research_class):
+    def test_execute_research_success(
+        self, mock_memory, mock_logger,
+        research_output, analyst_output, strategy_output, confidence_scores
+    ):
         """Test successful research execution"""
-        # Setup mocks
-        mock_memory = Mock()
-        mock_memory.create_session.return_value = "session_123"
-        mock_logger = Mock()
-        
-        # Mock agent outputs
-        research_output = AgentOutput(
-            agent_name="research_agent",
-            task_id="task_001",
-            results={"summary": "Research findings", "total_sources": 3},
-            self_confidence=75,
-            reasoning="Research completed",
-            sources=["https://example.com"],
-            execution_time=2.0
-        )
-        
-        analyst_output = AgentOutput(
-            agent_name="analyst_agent",
-            task_id="task_002",
-            results={"insights": [{"type": "test", "insight": "Test"}], "patterns": []},
-            self_confidence=80,
-            reasoning="Analysis completed",
-            sources=[],
-            execution_time=1.5
-        )
-        
-        strategy_output = AgentOutput(
-            agent_name="strategy_agent",
-            task_id="task_003",
-            results={"recommendations": [{"title": "Test"}], "action_plan": []},
-            self_confidence=85,
-            reasoning="Strategy completed",
-            sources=[],
-            execution_time=1.0
-        )
-        
-        # Mock agents
-        mock_research = Mock()
-        mock_research.agent_name = "research_agent"
-        mock_research.execute.return_value = research_output
-        mock_research.calculate_confidence.return_value = ConfidenceScore(
-            overall=0.75,
-            factors={"test": 0.75},
-            agent_type=AgentType.RESEARCH,
-            reasoning="Test"
-        )
-        mock_research.reset_retry_count = Mock()
-        mock_research_class.return_value = mock_research
-        
-        mock_analyst = Mock()
-        mock_analyst.agent_name = "analyst_agent"
-        mock_analyst.execute.return_value = analyst_output
-        mock_analyst.calculate_confidence.return_value = ConfidenceScore(
-            overall=0.80,
-            factors={"test": 0.80},
-            agent_type=AgentType.ANALYST,
-            reasoning="Test"
-        )
-        mock_analyst.reset_retry_count = Mock()
-        mock_analyst_class.return_value = mock_analyst
-        
-        mock_strategy = Mock()
-        mock_strategy.agent_name = "strategy_agent"
-        mock_strategy.execute.return_value = strategy_output
-        mock_strategy.calculate_confidence.return_value = ConfidenceScore(
-            overall=0.85,
-            factors={"test": 0.85},
-            agent_type=AgentType.STRATEGY,
-            reasoning="Test"
+        # Create boss agent with stub agents
+        boss = BossAgent(
+            mock_memory,
+            mock_logger,
+            None,
+            research_agent_cls=_agent_cls(_make_stub_agent(
+                "research_agent", research_output, confidence_scores["research"]
+            )),
+            analyst_agent_cls=_agent_cls(_make_stub_agent(
+                "analyst_agent", analyst_output, confidence_scores["analyst"]
+            )),
+            strategy_agent_cls=_agent_cls(_make_stub_agent(
+                "strategy_agent", strategy_output, confidence_scores["strategy"]
+            ))
         )
-        mock_strategy.reset_retry_count = Mock()
-        mock_strategy_class.return_value = mock_strategy
-        
-        # Create boss agent
-        boss = BossAgent(mock_memory, mock_logger)
         
         # Execute research
         result = boss.execute_research("test research goal")
@@ -149,12 +256,8 @@ class TestBossAgent:
         assert mock_memory.store_final_result.called
         assert mock_memory.update_session_status.called
     
-    def test_get_workflow_state(self):
+    def test_get_workflow_state(self, boss):
         """Test getting workflow state"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        boss = BossAgent(mock_memory, mock_logger)
         boss.session_id = "session_123"
         boss.current_phase = WorkflowPhase.RESEARCH
         boss.active_agent = "research_agent"
@@ -167,12 +270,8 @@ class TestBossAgent:
         assert "completed_agents" in state
         assert "confidence_scores" in state
     
-    def test_reset(self):
+    def test_reset(self, boss):
         """Test resetting workflow state"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        boss = BossAgent(mock_memory, mock_logger)
         boss.session_id = "session_123"
         boss.current_phase = WorkflowPhase.RESEARCH
         boss.active_agent = "research_agent"
@@ -186,138 +285,29 @@ class TestBossAgent:
         assert len(boss.agent_outputs) == 0
         assert len(boss.confidence_scores) == 0
     
-    @patch('boss_agent.ResearchAgent')
-    def test_execute_phase_success(self, mock_research_class):
-        """Test successful phase execution"""
-        mock_memory = Mock()
-        mock_memory.create_session.return_value = "session_123"
-        mock_logger = Mock()
-        
-        # Mock agent
-        research_output = AgentOutput(
-            agent_name="research_agent",
-            task_id="task_001",
-            results={"summary": "Test"},
-            self_confidence=75,
-            reasoning="Test",
-            sources=[],
-            execution_time=1.0
-        )
-        
-        mock_research = Mock()
-        mock_research.agent_name = "research_agent"
-        mock_research.execute.return_value = research_output
-        mock_research.calculate_confidence.return_value = ConfidenceScore(
-            overall=0.75,
-            factors={},
-            agent_type=AgentType.RESEARCH,
-            reasoning="Test"
-        )
-        mock_research.increment_retry_count = Mock()
-        mock_research_class.return_value = mock_research
-        
-        boss = BossAgent(mock_memory, mock_logger)
-        boss.session_id = "session_123"
-        
-        output = boss._execute_phase(
-            agent=mock_research,
-            task_description="Test task",
-            previous_outputs={}
-        )
-        
-        assert output is not None
-        assert output.agent_name == "research_agent"
-        assert "research_agent" in boss.agent_outputs
-        assert "research_agent" in boss.confidence_scores
-    
-    @patch('boss_agent.ResearchAgent')
-    def test_execute_phase_low_confidence_retry(self, mock_research_class):
-        """Test phase execution with low confidence triggering retry"""
-        mock_memory = Mock()
-        mock_memory.create_session.return_value = "session_123"
-        mock_logger = Mock()
-        
-        # Mock agent with low confidence first, then high
-        outputs = [
-            AgentOutput(
-                agent_name="research_agent",
-                task_id="task_001",
-                results={"summary": "Low quality"},
-                self_confidence=40,
-                reasoning="Low confidence",
-                sources=[],
-                execution_time=1.0
-            ),
-            AgentOutput(
-                agent_name="research_agent",
-                task_id="task_001",
-                results={"summary": "High quality"},
-                self_confidence=80,
-                reasoning="High confidence",
-                sources=[],
-                execution_time=1.0
-            )
+    @pytest.mark.parametrize("scenario", _PHASE_SCENARIOS)
+    def test_execute_phase(
+        self, scenario, mock_memory, mock_logger, mock_agents, agent_classes, make_output
+    ):
+        """Test phase execution across confidence and retry scenarios"""
+        mock_research = mock_agents["research"]
+        mock_research.execute.side_effect = [
+            make_output(results={"summary": "Test"}, self_confidence=confidence)
+            for confidence in scenario.confidences
         ]
-        
-        confidence_scores = [
-            ConfidenceScore(overall=0.40, factors={}, agent_type=AgentType.RESEARCH, reasoning="Low"),
-            ConfidenceScore(overall=0.80, factors={}, agent_type=AgentType.RESEARCH, reasoning="High")
+        mock_research.calculate_confidence.side_effect = [
+            ConfidenceScore(confidence / 100, {}, AgentType.RESEARCH, "Test")
+            for confidence in scenario.confidences
         ]
         
-        mock_research = Mock()
-        mock_research.agent_name = "research_agent"
-        mock_research.execute.side_effect = outputs
-        mock_research.calculate_confidence.side_effect = confidence_scores
-        mock_research.increment_retry_count = Mock()
-        mock_research_class.return_value = mock_research
-        
-        boss = BossAgent(mock_memory, mock_logger, confidence_threshold=0.50)
-        boss.session_id = "session_123"
-        
-        output = boss._execute_phase(
-            agent=mock_research,
-            task_description="Test task",
-            previous_outputs={}
-        )
-        
-        # Should succeed on second attempt
-        assert output is not None
-        assert output.self_confidence == 80
-        assert mock_research.increment_retry_count.called
-    
-    @patch('boss_agent.ResearchAgent')
-    def test_execute_phase_max_retries_exceeded(self, mock_research_class):
-        """Test phase execution failing after max retries"""
-        mock_memory = Mock()
-        mock_memory.create_session.return_value = "session_123"
-        mock_logger = Mock()
-        
-        # Mock agent always returning unacceptably low confidence (below min_acceptable)
-        low_output = AgentOutput(
-            agent_name="research_agent",
-            task_id="task_001",
-            results={"summary": "Very low quality"},
-            self_confidence=20,
-            reasoning="Very low confidence",
-            sources=[],
-            execution_time=1.0
-        )
-        
-        very_low_confidence = ConfidenceScore(
-            overall=0.20,  # Below min_acceptable (0.40)
-            factors={},
-            agent_type=AgentType.RESEARCH,
-            reasoning="Very low"
+        boss = BossAgent(
+            mock_memory,
+            mock_logger,
+            None,
+            max_retries=scenario.max_retries,
+            confidence_threshold=scenario.confidence_threshold,
+            **agent_classes
         )
-        
-        mock_research = Mock()
-        mock_research.agent_name = "research_agent"
-        mock_research.execute.return_value = low_output
-        mock_research.calculate_confidence.return_value = very_low_confidence
-        mock_research.increment_retry_count = Mock()
-        mock_research_class.return_value = mock_research
-        
-        boss = BossAgent(mock_memory, mock_logger, max_retries=2, confidence_threshold=0.50)
         boss.session_id = "session_123"
         
         output = boss._execute_phase(
@@ -326,17 +316,18 @@ class TestBossAgent:
             previous_outputs={}
         )
         
-        # Should return None immediately due to error_recovery (below min_acceptable)
-        assert output is None
-        # Should only execute once since it triggers error_recovery
-        assert mock_research.execute.call_count == 1
+        if scenario.expected_confidence is None:
+            assert output is None
+        else:
+            assert output.agent_name == "research_agent"
+            assert output.self_confidence == scenario.expected_confidence
+            assert boss.agent_outputs["research_agent"] is output
+            assert "research_agent" in boss.confidence_scores
+        assert mock_research.execute.call_count == scenario.expected_executions
+        assert mock_research.increment_retry_count.call_count == scenario.expected_retries
     
-    def test_aggregate_results(self):
+    def test_aggregate_results(self, boss):
         """Test result aggregation"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        boss = BossAgent(mock_memory, mock_logger)
         boss.session_id = "session_123"
         
         # Add mock outputs
@@ -379,18 +370,20 @@ class TestBossAgent:
         result = boss._aggregate_results("test goal", start_time=0.0)
         
         assert isinstance(result, ResearchResult)
-        assert result.goal == "test goal"
-        assert len(result.agents_involved) == 3
-        assert len(result.insights) > 0
-        assert len(result.sources) == 1
-        assert result.sources[0]["reliability"] == "high"  # .edu domain
+        assert {
+            "goal": result.goal,
+            "agents_involved": set(result.agents_involved),
+            "has_insights": bool(result.insights),
+            "source_reliability": [source["reliability"] for source in result.sources]
+        } == {
+            "goal": "test goal",
+            "agents_involved": {"research_agent", "analyst_agent", "strategy_agent"},
+            "has_insights": True,
+            "source_reliability": ["high"]  # .edu domain
+        }
     
-    def test_create_error_result(self):
+    def test_create_error_result(self, boss):
         """Test error result creation"""
-        mock_memory = Mock()
-        mock_logger = Mock()
-        
-        boss = BossAgent(mock_memory, mock_logger)
         boss.session_id = "session_123"
         
         result = boss._create_error_result("test goal", "Test error message")
@@ -400,22 +393,13 @@ class TestBossAgent:
         assert result.session_id == "session_123"
         assert "Error" in result.insights[0]
     
-    @patch('boss_agent.ResearchAgent')
-    def test_execute_research_with_exception(self, mock_research_class):
+    def test_execute_research_with_exception(self, mock_memory, mock_logger, mock_agents, agent_classes):
         """Test research execution with exception in agent"""
-        mock_memory = Mock()
-        mock_memory.create_session.return_value = "session_123"
-        mock_logger = Mock()
-        
         # Mock agent that raises exception
-        mock_research = Mock()
-        mock_research.agent_name = "research_agent"
+        mock_research = mock_agents["research"]
         mock_research.execute.side_effect = Exception("Test error")
-        mock_research.increment_retry_count = Mock()
-        mock_research.reset_retry_count = Mock()
-        mock_research_class.return_value = mock_research
         
-        boss = BossAgent(mock_memory, mock_logger, max_retries=1)
+        boss = BossAgent(mock_memory, mock_logger, None, max_retries=1, **agent_classes)
         
         result = boss.execute_research("test goal")
         
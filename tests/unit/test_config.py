@@ -3,28 +3,57 @@ Unit tests for configuration module.
 """
 
 import os
+import re
 import pytest
 from config import Config
 
 
+_TIMEOUT_STATES = [
+    "PLANNING",
+    "TOOL_EXECUTION",
+    "OBSERVATION",
+    "REFLECTION",
+    "CONFIDENCE_EVALUATION",
+    "REPLANNING",
+    "ERROR_RECOVERY",
+]
+
+_MISSING_API_KEY_RE = re.compile("OPENROUTER_API_KEY is required")
+_EMAIL_NOT_CONFIGURED_RE = re.compile("email addresses are not configured")
+_WEBHOOK_NOT_CONFIGURED_RE = re.compile("webhook URL is not configured")
+
+# Config attributes the validate tests overwrite directly
+_MUTATED_KEYS = [
+    "OPENROUTER_API_KEY",
+    "ESCALATION_EMAIL_ENABLED",
+    "ESCALATION_EMAIL_FROM",
+    "ESCALATION_EMAIL_TO",
+    "ESCALATION_WEBHOOK_ENABLED",
+    "ESCALATION_WEBHOOK_URL",
+]
+
+
 class TestConfig:
     """Test suite for Config class."""
     
+    @pytest.fixture(autouse=True)
+    def _config_snapshot(self):
+        """Restore Config attributes mutated by a test."""
+        original = {key: getattr(Config, key) for key in _MUTATED_KEYS}
+        yield
+        for key, value in original.items():
+            setattr(Config, key, value)
+    
     def test_config_loads_defaults(self):
         """Test that config loads with default values."""
         assert Config.DATABASE_PATH == os.getenv("DATABASE_PATH", "./data/agent_memory.db")
         assert Config.LOG_DIR == os.getenv("LOG_DIR", "./logs")
         assert Config.LOG_LEVEL == os.getenv("LOG_LEVEL", "INFO")
     
-    def test_config_timeout_values(self):
+    @pytest.mark.parametrize("state", _TIMEOUT_STATES)
+    def test_config_timeout_values(self, state):
         """Test that timeout values are integers."""
-        assert isinstance(Config.TIMEOUT_PLANNING, int)
-        assert isinstance(Config.TIMEOUT_TOOL_EXECUTION, int)
-        assert isinstance(Config.TIMEOUT_OBSERVATION, int)
-        assert isinstance(Config.TIMEOUT_REFLECTION, int)
-        assert isinstance(Config.TIMEOUT_CONFIDENCE_EVALUATION, int)
-        assert isinstance(Config.TIMEOUT_REPLANNING, int)
-        assert isinstance(Config.TIMEOUT_ERROR_RECOVERY, int)
+        assert isinstance(getattr(Config, f"TIMEOUT_{state}"), int)
     
     def test_config_confidence_thresholds(self):
         """Test that confidence thresholds are valid."""
@@ -37,23 +66,18 @@ class TestConfig:
         assert isinstance(Config.RATE_LIMIT_DELAY, float)
         assert Config.RATE_LIMIT_DELAY > 0
     
-    def test_get_state_timeouts(self):
-        """Test that get_state_timeouts returns correct dictionary."""
+    @pytest.mark.parametrize("state", _TIMEOUT_STATES)
+    def test_get_state_timeouts(self, state):
+        """Test that get_state_timeouts returns a positive integer per state."""
         timeouts = Config.get_state_timeouts()
         
-        assert isinstance(timeouts, dict)
-        assert "PLANNING" in timeouts
-        assert "TOOL_EXECUTION" in timeouts
-        assert "OBSERVATION" in timeouts
-        assert "REFLECTION" in timeouts
-        assert "CONFIDENCE_EVALUATION" in timeouts
-        assert "REPLANNING" in timeouts
-        assert "ERROR_RECOVERY" in timeouts
-        
         # All values should be positive integers
-        for key, value in timeouts.items():
-            assert isinstance(value, int)
-            assert value > 0
+        assert isinstance(timeouts[state], int)
+        assert timeouts[state] > 0
+    
+    def test_get_state_timeouts_covers_all_states(self):
+        """Test that get_state_timeouts returns exactly the known states."""
+        assert set(Config.get_state_timeouts()) == set(_TIMEOUT_STATES)
     
     def test_display_config(self):
         """Test that display_config returns formatted string."""
@@ -69,37 +93,50 @@ class TestConfig:
             assert Config.OPENROUTER_API_KEY not in config_str
             assert "***" in config_str
     
-    def test_validate_missing_api_key(self, monkeypatch):
+    def test_validate_missing_api_key(self):
         """Test that validate raises error when API key is missing."""
         # Temporarily remove API key
-        monkeypatch.setattr(Config, "OPENROUTER_API_KEY", "")
+        Config.OPENROUTER_API_KEY = ""
         
-        with pytest.raises(ValueError, match="OPENROUTER_API_KEY is required"):
+        with pytest.raises(ValueError, match=_MISSING_API_KEY_RE):
             Config.validate()
     
-    def test_validate_email_escalation_config(self, monkeypatch):
+    def test_validate_email_escalation_config(self):
         """Test that validate checks email escalation configuration."""
         # Set API key first (required)
-        monkeypatch.setattr(Config, "OPENROUTER_API_KEY", "test-key")
+        Config.OPENROUTER_API_KEY = "test-key"
         # Enable email escalation without proper config
-        monkeypatch.setattr(Config, "ESCALATION_EMAIL_ENABLED", True)
-        monkeypatch.setattr(Config, "ESCALATION_EMAIL_FROM", "")
-        monkeypatch.setattr(Config, "ESCALATION_EMAIL_TO", "")
+        Config.ESCALATION_EMAIL_ENABLED = True
+        Config.ESCALATION_EMAIL_FROM = ""
+        Config.ESCALATION_EMAIL_TO = ""
         
-        with pytest.raises(ValueError, match="email addresses are not configured"):
+        with pytest.raises(ValueError, match=_EMAIL_NOT_CONFIGURED_RE):
             Config.validate()
     
-    def test_validate_webhook_escalation_config(self, monkeypatch):
+    def test_validate_webhook_escalation_config(self):
         """Test that validate checks webhook escalation configuration."""
         # Set API key first (required)
-        monkeypatch.setattr(Config, "OPENROUTER_API_KEY", "test-key")
+        Config.OPENROUTER_API_KEY = "test-key"
         # Enable webhook escalation without proper config
-        monkeypatch.setattr(Config, "ESCALATION_WEBHOOK_ENABLED", True)
-        monkeypatch.setattr(Config, "ESCALATION_WEBHOOK_URL", "")
+        Config.ESCALATION_WEBHOOK_ENABLED = True
+        Config.ESCALATION_WEBHOOK_URL = ""
         
-        with pytest.raises(ValueError, match="webhook URL is not configured"):
+        with pytest.raises(ValueError, match=_WEBHOOK_NOT_CONFIGURED_RE):
             Config.validate()
     
+    def test_validators_pass_when_configured(self):
+        """Test that each validation check passes with complete configuration."""
+        Config.OPENROUTER_API_KEY = "test-key"
+        Config.ESCALATION_EMAIL_ENABLED = True
+        Config.ESCALATION_EMAIL_FROM = "agent@example.com"
+        Config.ESCALATION_EMAIL_TO = "ops@example.com"
+        Config.ESCALATION_WEBHOOK_ENABLED = True
+        Config.ESCALATION_WEBHOOK_URL = "https://example.com/hook"
+        
+        for check, _ in Config._VALIDATORS:
+            assert check(Config)
+        Config.validate()
+    
     def test_boolean_env_vars(self, monkeypatch):
         """Test that boolean environment variables are parsed correctly."""
         # Test true values
@@ -6,6 +6,7 @@ Tests serialization, deserialization, validation, and edge cases for all data mo
 
 import pytest
 import json
+from dataclasses import asdict, replace
 from datetime import datetime
 from uuid import UUID
 
@@ -22,6 +23,57 @@ from models.data_models import (
 )
 
 
+@pytest.fixture(scope="module")
+def agent_output():
+    """Valid AgentOutput shared by bounds tests, which overwrite the field under test."""
+    return AgentOutput(
+        agent_name="research_agent",
+        task_id="task-001",
+        results={},
+        self_confidence=85,
+        reasoning="Test",
+        sources=[],
+        execution_time=1.0
+    )
+
+
+@pytest.fixture(scope="module")
+def evaluation_result():
+    """Valid EvaluationResult shared by bounds tests, which overwrite the field under test."""
+    return EvaluationResult(
+        boss_confidence=90,
+        decision="proceed",
+        reasoning="Test"
+    )
+
+
+@pytest.fixture(scope="module")
+def model_response():
+    """Valid ModelResponse shared by bounds tests, which overwrite the fields under test."""
+    return ModelResponse(
+        model="qwen-4b",
+        text="Test",
+        tokens_used=10,
+        latency=1.0,
+        success=True
+    )
+
+
+@pytest.fixture(scope="module")
+def research_result():
+    """Valid ResearchResult shared read-only; tests derive variants with replace()."""
+    return ResearchResult.create_new(
+        goal="Test goal",
+        agents_involved=["research_agent"],
+        confidence_scores={"research_agent": {"self": 85, "boss": 90}},
+        competitors=[],
+        insights=[],
+        recommendations=[],
+        sources=[{"url": "https://example.com"}],
+        overall_confidence=85
+    )
+
+
 class TestTask:
     """Tests for Task data model."""
     
@@ -112,32 +164,32 @@ class TestAgentOutput:
         )
         assert output.validate() is True
     
-    def test_agent_output_validation_confidence_bounds(self):
+    @pytest.mark.parametrize("confidence,expected", [
+        (-1, False),
+        (0, True),
+        (100, True),
+        (101, False),
+    ])
+    def test_agent_output_validation_confidence_bounds(self, agent_output, confidence, expected):
         """Test agent output validation enforces confidence bounds."""
-        # Test lower bound
+        agent_output.self_confidence = confidence
+        assert agent_output.validate() is expected
+    
+    def test_agent_output_validation_negative_time(self):
+        """Test agent output validation fails with negative execution time."""
         output = AgentOutput(
             agent_name="research_agent",
             task_id="task-001",
             results={},
-            self_confidence=-1,
+            self_confidence=85,
             reasoning="Test",
             sources=[],
-            execution_time=1.0
+            execution_time=-1.0
         )
         assert output.validate() is False
-        
-        # Test upper bound
-        output.self_confidence = 101
-        assert output.validate() is False
-        
-        # Test valid bounds
-        output.self_confidence = 0
-        assert output.validate() is True
-        output.self_confidence = 100
-        assert output.validate() is True
     
-    def test_agent_output_validation_negative_time(self):
-        """Test agent output validation fails with negative execution time."""
+    def test_agent_output_rejects_unknown_attributes(self):
+        """Test agent output uses slots and rejects undeclared attributes."""
         output = AgentOutput(
             agent_name="research_agent",
             task_id="task-001",
@@ -145,9 +197,11 @@ class TestAgentOutput:
             self_confidence=85,
             reasoning="Test",
             sources=[],
-            execution_time=-1.0
+            execution_time=1.0
         )
-        assert output.validate() is False
+        assert not hasattr(output, "__dict__")
+        with pytest.raises(AttributeError):
+            output.confidence = 90
 
 
 class TestEvaluationResult:
@@ -173,14 +227,18 @@ class TestEvaluationResult:
         )
         assert result.validate() is True
     
-    def test_evaluation_result_validation_confidence_bounds(self):
+    @pytest.mark.parametrize("confidence,expected", [
+        (-1, False),
+        (0, True),
+        (100, True),
+        (101, False),
+    ])
+    def test_evaluation_result_validation_confidence_bounds(
+        self, evaluation_result, confidence, expected
+    ):
         """Test evaluation result validation enforces confidence bounds."""
-        result = EvaluationResult(
-            boss_confidence=101,
-            decision="proceed",
-            reasoning="Test"
-        )
-        assert result.validate() is False
+        evaluation_result.boss_confidence = confidence
+        assert evaluation_result.validate() is expected
     
     def test_evaluation_result_validation_invalid_decision(self):
         """Test evaluation result validation fails with invalid decision."""
@@ -226,9 +284,11 @@ class TestSearchResult:
             timestamp="2024-01-15T10:30:00Z"
         )
         result_dict = result.to_dict()
-        assert isinstance(result_dict, dict)
+        assert type(result_dict) is dict
         assert result_dict["title"] == "Test"
         assert result_dict["url"] == "https://example.com"
+        # The hand-written literal must stay in sync with the declared fields
+        assert result_dict == asdict(result)
 
 
 class TestModelResponse:
@@ -283,16 +343,18 @@ class TestModelResponse:
         )
         assert response.validate() is False
     
-    def test_model_response_validation_negative_values(self):
+    @pytest.mark.parametrize("tokens_used,latency,expected", [
+        (-1, 1.0, False),
+        (10, -1.0, False),
+        (0, 0.0, True),
+    ])
+    def test_model_response_validation_negative_values(
+        self, model_response, tokens_used, latency, expected
+    ):
         """Test model response validation fails with negative values."""
-        response = ModelResponse(
-            model="qwen-4b",
-            text="Test",
-            tokens_used=-1,
-            latency=1.0,
-            success=True
-        )
-        assert response.validate() is False
+        model_response.tokens_used = tokens_used
+        model_response.latency = latency
+        assert model_response.validate() is expected
 
 
 class TestToolResult:
@@ -361,148 +423,104 @@ class TestResearchResult:
         assert result.timestamp is not None
         
         # Validate UUID format
-        UUID(result.session_id)
+        assert UUID(result.session_id).version == 4
         
         # Validate ISO 8601 timestamp
-        datetime.fromisoformat(result.timestamp.replace('Z', '+00:00'))
+        datetime.fromisoformat(result.timestamp)
     
-    def test_research_result_to_json(self):
+    def test_research_result_to_json(self, research_result):
         """Test research result serialization to JSON."""
-        result = ResearchResult.create_new(
-            goal="Test goal",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
-        )
+        result = research_result
         
         json_str = result.to_json()
-        assert isinstance(json_str, str)
+        assert type(json_str) is str
         
         # Verify it's valid JSON
         parsed = json.loads(json_str)
         assert parsed["goal"] == "Test goal"
         assert parsed["overall_confidence"] == 85
     
-    def test_research_result_to_dict(self):
-        """Test research result conversion to dict."""
-        result = ResearchResult.create_new(
-            goal="Test goal",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
+    def test_research_result_to_json_matches_stdlib(self, research_result):
+        """Test that to_json escapes, NaN and big ints behave like json.dumps."""
+        result = replace(
+            research_result,
+            goal="Caf\u00e9 research",
+            competitors=[{"funding": 2**70, "margin": float("nan")}]
         )
         
+        json_str = result.to_json()
+        assert json_str == json.dumps(result.to_dict(), indent=2)
+        assert "Caf\\u00e9" in json_str
+        
+        reconstructed = ResearchResult.from_json(json_str)
+        assert reconstructed.competitors[0]["funding"] == 2**70
+        assert reconstructed.goal == result.goal
+    
+    def test_research_result_to_dict(self, research_result):
+        """Test research result conversion to dict."""
+        result = research_result
+        
         result_dict = result.to_dict()
-        assert isinstance(result_dict, dict)
+        assert type(result_dict) is dict
         assert "session_id" in result_dict
         assert "goal" in result_dict
     
-    def test_research_result_validation_success(self):
+    def test_research_result_validation_success(self, research_result):
         """Test research result validation with valid data."""
-        result = ResearchResult.create_new(
-            goal="Test goal",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[{"url": "https://example.com"}],
-            overall_confidence=85
-        )
+        result = research_result
         assert result.validate() is True
     
-    def test_research_result_validation_invalid_uuid(self):
+    @pytest.mark.parametrize("session_id", [
+        "not-a-uuid",
+        "12345678123456781234567812345678",
+        "{12345678-1234-5678-1234-567812345678}",
+        None,
+    ], ids=["garbage", "no_hyphens", "braces", "none"])
+    def test_research_result_validation_invalid_uuid(self, research_result, session_id):
         """Test research result validation fails with invalid UUID."""
-        result = ResearchResult(
-            session_id="not-a-uuid",
-            goal="Test",
-            timestamp="2024-01-15T10:30:00Z",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
-        )
+        result = replace(research_result, session_id=session_id)
         assert result.validate() is False
     
-    def test_research_result_validation_empty_agents(self):
+    def test_research_result_validation_empty_agents(self, research_result):
         """Test research result validation fails with empty agents list."""
-        result = ResearchResult.create_new(
-            goal="Test",
-            agents_involved=[],
-            confidence_scores={},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
-        )
+        result = replace(research_result, agents_involved=[], confidence_scores={})
         assert result.validate() is False
     
-    def test_research_result_validation_confidence_scores(self):
+    @pytest.mark.parametrize("timestamp", [
+        "15/01/2024 10:30",
+        "2024-01",
+        "2024-001",
+        "2024-01-01T24:00:00",
+    ], ids=["day_first", "year_month", "ordinal", "hour_24"])
+    def test_research_result_validation_invalid_timestamp(self, research_result, timestamp):
+        """Test research result validation fails with timestamps fromisoformat rejects."""
+        result = replace(research_result, timestamp=timestamp)
+        assert result.validate() is False
+    
+    def test_research_result_validation_confidence_scores(self, research_result):
         """Test research result validation checks confidence score structure."""
-        result = ResearchResult.create_new(
-            goal="Test",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85}},  # Missing 'boss'
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
+        result = replace(
+            research_result,
+            confidence_scores={"research_agent": {"self": 85}}  # Missing 'boss'
         )
         assert result.validate() is False
     
-    def test_research_result_validation_confidence_bounds(self):
+    def test_research_result_validation_confidence_bounds(self, research_result):
         """Test research result validation enforces confidence bounds."""
-        result = ResearchResult.create_new(
-            goal="Test",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 101, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[],
-            overall_confidence=85
+        result = replace(
+            research_result,
+            confidence_scores={"research_agent": {"self": 101, "boss": 90}}
         )
         assert result.validate() is False
     
-    def test_research_result_validation_sources_require_url(self):
+    def test_research_result_validation_sources_require_url(self, research_result):
         """Test research result validation requires URL in sources."""
-        result = ResearchResult.create_new(
-            goal="Test",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[{"title": "No URL"}],
-            overall_confidence=85
-        )
+        result = replace(research_result, sources=[{"title": "No URL"}])
         assert result.validate() is False
     
-    def test_research_result_validate_schema(self):
+    def test_research_result_validate_schema(self, research_result):
         """Test research result schema validation."""
-        result = ResearchResult.create_new(
-            goal="Test",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[],
-            insights=[],
-            recommendations=[],
-            sources=[{"url": "https://example.com"}],
-            overall_confidence=85
-        )
+        result = research_result
         assert result.validate_schema() is True
     
     def test_research_result_round_trip_serialization(self):
@@ -521,15 +539,12 @@ class TestResearchResult:
             overall_confidence=87
         )
         
-        # Serialize to JSON
-        json_str = original.to_json()
-        
-        # Deserialize back
-        data = json.loads(json_str)
-        reconstructed = ResearchResult(**data)
+        # Serialize to JSON and back
+        reconstructed = ResearchResult.from_json(original.to_json())
         
         # Verify fields match
         assert reconstructed.goal == original.goal
         assert reconstructed.session_id == original.session_id
         assert reconstructed.overall_confidence == original.overall_confidence
         assert len(reconstructed.agents_involved) == len(original.agents_involved)
+        assert reconstructed == original
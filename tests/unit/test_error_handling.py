@@ -2,8 +2,9 @@
 Unit tests for error handling module
 """
 
+import random
+
 import pytest
-import time
 from unittest.mock import Mock
 
 from error_handling import (
@@ -15,6 +16,80 @@ from error_handling import (
 )
 
 
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record backoff delays instead of sleeping; returns the list of delays."""
+    calls = []
+    monkeypatch.setattr("error_handling.time.sleep", calls.append)
+    return calls
+
+
+class _ScriptedCall:
+    """Callable that raises or returns each outcome in turn and counts calls."""
+    
+    def __init__(self, *outcomes):
+        self._outcomes = iter(outcomes)
+        self.call_count = 0
+    
+    def __call__(self):
+        self.call_count += 1
+        outcome = next(self._outcomes)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+# (exception class, constructor args, expected attributes, message substrings, severity)
+_SUBCLASS_CASES = [
+    pytest.param(
+        ConfigurationError, ("Invalid config",), {},
+        ["Invalid config"], ErrorSeverity.CRITICAL,
+        id="configuration",
+    ),
+    pytest.param(
+        ToolExecutionError, ("web_search", "Connection failed"), {"tool_name": "web_search"},
+        ["web_search", "Connection failed"], ErrorSeverity.MEDIUM,
+        id="tool_execution",
+    ),
+    pytest.param(
+        RateLimitError, ("api_service", 30.0), {"service": "api_service", "retry_after": 30.0},
+        ["api_service", "30"], ErrorSeverity.MEDIUM,
+        id="rate_limit",
+    ),
+    pytest.param(
+        ModelError, ("gpt-4", "API error"), {"model_name": "gpt-4"},
+        ["gpt-4", "API error"], ErrorSeverity.HIGH,
+        id="model",
+    ),
+    pytest.param(
+        AgentExecutionError, ("research_agent", "Execution failed"), {"agent_name": "research_agent"},
+        ["research_agent", "Execution failed"], ErrorSeverity.HIGH,
+        id="agent_execution",
+    ),
+    pytest.param(
+        MemorySystemError, ("Database connection lost",), {},
+        ["Database connection lost"], ErrorSeverity.HIGH,
+        id="memory_system",
+    ),
+    pytest.param(
+        ValidationError, ("email", "Invalid format"), {"field": "email"},
+        ["email", "Invalid format"], ErrorSeverity.LOW,
+        id="validation",
+    ),
+    pytest.param(
+        TimeoutError, ("api_call", 30.0), {"operation": "api_call", "timeout": 30.0},
+        ["api_call", "30"], ErrorSeverity.MEDIUM,
+        id="timeout",
+    ),
+    pytest.param(
+        ConfidenceError, ("analyst_agent", 0.45, 0.50),
+        {"agent_name": "analyst_agent", "confidence": 0.45, "threshold": 0.50},
+        ["analyst_agent", "0.45", "0.50"], ErrorSeverity.MEDIUM,
+        id="confidence",
+    ),
+]
+
+
 class TestCustomExceptions:
     """Tests for custom exception hierarchy"""
     
@@ -32,83 +107,17 @@ class TestCustomExceptions:
         assert error_dict["message"] == "Test error"
         assert error_dict["context"] == {"key": "value"}
     
-    def test_configuration_error(self):
-        """Test ConfigurationError"""
-        error = ConfigurationError("Invalid config")
-        
-        assert "Invalid config" in str(error)
-        assert error.severity == ErrorSeverity.CRITICAL
-    
-    def test_tool_execution_error(self):
-        """Test ToolExecutionError"""
-        error = ToolExecutionError("web_search", "Connection failed")
-        
-        assert "web_search" in str(error)
-        assert "Connection failed" in str(error)
-        assert error.tool_name == "web_search"
-        assert error.severity == ErrorSeverity.MEDIUM
-    
-    def test_rate_limit_error(self):
-        """Test RateLimitError"""
-        error = RateLimitError("api_service", retry_after=30.0)
-        
-        assert "api_service" in str(error)
-        assert "30" in str(error)
-        assert error.service == "api_service"
-        assert error.retry_after == 30.0
-    
-    def test_model_error(self):
-        """Test ModelError"""
-        error = ModelError("gpt-4", "API error")
-        
-        assert "gpt-4" in str(error)
-        assert "API error" in str(error)
-        assert error.model_name == "gpt-4"
-        assert error.severity == ErrorSeverity.HIGH
-    
-    def test_agent_execution_error(self):
-        """Test AgentExecutionError"""
-        error = AgentExecutionError("research_agent", "Execution failed")
-        
-        assert "research_agent" in str(error)
-        assert "Execution failed" in str(error)
-        assert error.agent_name == "research_agent"
-    
-    def test_memory_system_error(self):
-        """Test MemorySystemError"""
-        error = MemorySystemError("Database connection lost")
-        
-        assert "Database connection lost" in str(error)
-        assert error.severity == ErrorSeverity.HIGH
-    
-    def test_validation_error(self):
-        """Test ValidationError"""
-        error = ValidationError("email", "Invalid format")
-        
-        assert "email" in str(error)
-        assert "Invalid format" in str(error)
-        assert error.field == "email"
-        assert error.severity == ErrorSeverity.LOW
-    
-    def test_timeout_error(self):
-        """Test TimeoutError"""
-        error = TimeoutError("api_call", 30.0)
-        
-        assert "api_call" in str(error)
-        assert "30" in str(error)
-        assert error.operation == "api_call"
-        assert error.timeout == 30.0
-    
-    def test_confidence_error(self):
-        """Test ConfidenceError"""
-        error = ConfidenceError("analyst_agent", 0.45, 0.50)
-        
-        assert "analyst_agent" in str(error)
-        assert "0.45" in str(error)
-        assert "0.50" in str(error)
-        assert error.agent_name == "analyst_agent"
-        assert error.confidence == 0.45
-        assert error.threshold == 0.50
+    @pytest.mark.parametrize("cls,args,attrs,substrings,severity", _SUBCLASS_CASES)
+    def test_subclass_error(self, cls, args, attrs, substrings, severity):
+        """Test AgentSystemError subclasses format messages and set attributes"""
+        error = cls(*args)
+        
+        assert isinstance(error, AgentSystemError)
+        for name, value in attrs.items():
+            assert getattr(error, name) == value
+        for substring in substrings:
+            assert substring in str(error)
+        assert error.severity == severity
 
 
 class TestExponentialBackoff:
@@ -128,52 +137,70 @@ class TestExponentialBackoff:
         assert backoff.exponential_base == 2.0
         assert backoff.jitter is True
     
-    def test_initialization_invalid_base_delay(self):
-        """Test that invalid base_delay raises error"""
-        with pytest.raises(ValueError, match="base_delay must be positive"):
-            ExponentialBackoff(base_delay=0)
-    
-    def test_initialization_invalid_max_delay(self):
-        """Test that invalid max_delay raises error"""
-        with pytest.raises(ValueError, match="max_delay must be >= base_delay"):
-            ExponentialBackoff(base_delay=10.0, max_delay=5.0)
-    
-    def test_initialization_invalid_exponential_base(self):
-        """Test that invalid exponential_base raises error"""
-        with pytest.raises(ValueError, match="exponential_base must be > 1"):
-            ExponentialBackoff(exponential_base=1.0)
-    
-    def test_calculate_delay_first_attempt(self):
-        """Test delay calculation for first attempt"""
-        backoff = ExponentialBackoff(base_delay=1.0, jitter=False)
-        delay = backoff.calculate_delay(0)
-        
-        assert delay == 1.0
-    
-    def test_calculate_delay_exponential_growth(self):
-        """Test exponential growth of delays"""
-        backoff = ExponentialBackoff(base_delay=1.0, exponential_base=2.0, jitter=False)
-        
-        assert backoff.calculate_delay(0) == 1.0
-        assert backoff.calculate_delay(1) == 2.0
-        assert backoff.calculate_delay(2) == 4.0
-        assert backoff.calculate_delay(3) == 8.0
-    
-    def test_calculate_delay_max_cap(self):
-        """Test that delay is capped at max_delay"""
-        backoff = ExponentialBackoff(base_delay=1.0, max_delay=10.0, jitter=False)
+    @pytest.mark.parametrize("kwargs,error_match", [
+        ({"base_delay": 0}, "base_delay must be positive"),
+        ({"base_delay": 10.0, "max_delay": 5.0}, "max_delay must be >= base_delay"),
+        ({"exponential_base": 1.0}, "exponential_base must be > 1"),
+        ({"strategy": "linear"}, "strategy must be one of"),
+    ], ids=["base_delay", "max_delay", "exponential_base", "strategy"])
+    def test_initialization_invalid(self, kwargs, error_match):
+        """Test that invalid parameters raise errors"""
+        with pytest.raises(ValueError, match=error_match):
+            ExponentialBackoff(**kwargs)
+    
+    @pytest.mark.parametrize("attempt,expected", [
+        (0, 1.0),
+        (1, 2.0),
+        (2, 4.0),
+        (3, 8.0),
+        (10, 10.0),  # Capped at max_delay
+    ])
+    def test_calculate_delay(self, attempt, expected):
+        """Test exponential growth of delays up to max_delay"""
+        backoff = ExponentialBackoff(
+            base_delay=1.0,
+            max_delay=10.0,
+            exponential_base=2.0,
+            jitter=False
+        )
         
-        # After enough attempts, should cap at max_delay
-        delay = backoff.calculate_delay(10)
-        assert delay == 10.0
+        assert backoff.calculate_delay(attempt) == expected
     
     def test_calculate_delay_with_jitter(self):
         """Test that jitter adds randomness"""
-        backoff = ExponentialBackoff(base_delay=10.0, jitter=True)
+        backoff = ExponentialBackoff(base_delay=10.0, jitter=True, rng=random.Random(42))
         
         # With jitter, delay should be between 50% and 100% of calculated value
         delay = backoff.calculate_delay(0)
         assert 5.0 <= delay <= 10.0
+        assert delay == 10.0 * (0.5 + random.Random(42).random() * 0.5)
+    
+    def test_calculate_delay_decorrelated(self):
+        """Test decorrelated jitter draws from [base_delay, 3x previous delay]"""
+        backoff = ExponentialBackoff(
+            base_delay=1.0,
+            max_delay=20.0,
+            strategy="decorrelated",
+            rng=random.Random(42)
+        )
+        expected_rng = random.Random(42)
+        
+        prev = 1.0
+        for attempt in range(6):
+            delay = backoff.calculate_delay(attempt)
+            
+            assert 1.0 <= delay <= min(20.0, prev * 3)
+            assert delay == min(20.0, expected_rng.uniform(1.0, prev * 3))
+            prev = delay
+    
+    def test_calculate_delay_decorrelated_restarts_at_first_attempt(self):
+        """Test that attempt 0 restarts the decorrelated sequence"""
+        backoff = ExponentialBackoff(base_delay=1.0, strategy="decorrelated")
+        
+        for attempt in range(5):
+            backoff.calculate_delay(attempt)
+        
+        assert backoff.calculate_delay(0) <= 3.0
     
     def test_calculate_delay_negative_attempt(self):
         """Test that negative attempt raises error"""
@@ -182,16 +209,14 @@ class TestExponentialBackoff:
         with pytest.raises(ValueError, match="attempt must be non-negative"):
             backoff.calculate_delay(-1)
     
-    def test_sleep(self):
+    def test_sleep(self, fake_sleep):
         """Test sleep method"""
-        backoff = ExponentialBackoff(base_delay=0.01, jitter=False)
+        backoff = ExponentialBackoff(base_delay=1.0, jitter=False)
         
-        start = time.time()
         backoff.sleep(0)
-        duration = time.time() - start
+        backoff.sleep(2)
         
-        # Should sleep for approximately base_delay
-        assert duration >= 0.01
+        assert fake_sleep == [1.0, 4.0]
 
 
 class TestRetryWithBackoff:
@@ -206,20 +231,21 @@ class TestRetryWithBackoff:
         assert result == "success"
         assert mock_func.call_count == 1
     
-    def test_retry_on_exception(self):
+    def test_retry_on_exception(self, fake_sleep):
         """Test retry on exception"""
-        mock_func = Mock(side_effect=[Exception("Error 1"), Exception("Error 2"), "success"])
+        mock_func = _ScriptedCall(Exception("Error 1"), Exception("Error 2"), "success")
         
         result = retry_with_backoff(
             mock_func,
             max_retries=3,
-            backoff=ExponentialBackoff(base_delay=0.01)
+            backoff=ExponentialBackoff(base_delay=1.0, jitter=False)
         )
         
         assert result == "success"
         assert mock_func.call_count == 3
+        assert fake_sleep == [1.0, 2.0]
     
-    def test_max_retries_exhausted(self):
+    def test_max_retries_exhausted(self, fake_sleep):
         """Test that exception is raised when max retries exhausted"""
         mock_func = Mock(side_effect=Exception("Persistent error"))
         
@@ -227,27 +253,28 @@ class TestRetryWithBackoff:
             retry_with_backoff(
                 mock_func,
                 max_retries=2,
-                backoff=ExponentialBackoff(base_delay=0.01)
+                backoff=ExponentialBackoff(base_delay=1.0, jitter=False)
             )
         
         assert mock_func.call_count == 3  # Initial + 2 retries
+        assert fake_sleep == [1.0, 2.0]  # No sleep after the final attempt
     
-    def test_on_retry_callback(self):
+    def test_on_retry_callback(self, fake_sleep):
         """Test that on_retry callback is called"""
-        mock_func = Mock(side_effect=[Exception("Error"), "success"])
+        mock_func = _ScriptedCall(Exception("Error"), "success")
         mock_callback = Mock()
         
         retry_with_backoff(
             mock_func,
             max_retries=2,
-            backoff=ExponentialBackoff(base_delay=0.01),
+            backoff=ExponentialBackoff(base_delay=1.0),
             on_retry=mock_callback
         )
         
         assert mock_callback.called
         assert mock_callback.call_count == 1
     
-    def test_specific_exceptions(self):
+    def test_specific_exceptions(self, fake_sleep):
         """Test catching only specific exceptions"""
         mock_func = Mock(side_effect=ValueError("Wrong type"))
         
@@ -257,8 +284,10 @@ class TestRetryWithBackoff:
                 mock_func,
                 max_retries=2,
                 exceptions=(TypeError,),
-                backoff=ExponentialBackoff(base_delay=0.01)
+                backoff=ExponentialBackoff(base_delay=1.0)
             )
+        
+        assert fake_sleep == []
 
 
 class TestErrorContext:
@@ -294,20 +323,19 @@ class TestErrorContext:
         assert call_args[1]["context"]["operation"] == "test_operation"
         assert call_args[1]["context"]["input_size"] == 100
     
-    def test_error_context_duration_tracking(self):
+    def test_error_context_duration_tracking(self, monkeypatch):
         """Test that error context tracks duration"""
+        monkeypatch.setattr("error_handling.time.monotonic", iter([100.0, 100.5]).__next__)
         mock_logger = Mock()
         
         try:
             with ErrorContext(mock_logger, "test_operation") as ctx:
-                time.sleep(0.01)
                 raise Exception("Test")
         except Exception:
             pass
         
         call_args = mock_logger.log_error.call_args
-        assert "duration" in call_args[1]["context"]
-        assert call_args[1]["context"]["duration"] > 0
+        assert call_args[1]["context"]["duration"] == 0.5
 
 
 class TestHandleRateLimit:
@@ -322,12 +350,9 @@ class TestHandleRateLimit:
         assert result == "success"
         assert mock_func.call_count == 1
     
-    def test_handle_rate_limit_retry(self):
+    def test_handle_rate_limit_retry(self, fake_sleep):
         """Test retry on rate limit"""
-        mock_func = Mock(side_effect=[
-            RateLimitError("test_service"),
-            "success"
-        ])
+        mock_func = _ScriptedCall(RateLimitError("test_service"), "success")
         mock_logger = Mock()
         
         result = handle_rate_limit(mock_func, "test_service", logger=mock_logger)
@@ -335,8 +360,10 @@ class TestHandleRateLimit:
         assert result == "success"
         assert mock_func.call_count == 2
         assert mock_logger.log_decision.called
+        assert len(fake_sleep) == 1
+        assert 1.0 <= fake_sleep[0] <= 2.0  # 2s base delay with 50-100% jitter
     
-    def test_handle_rate_limit_exhausted(self):
+    def test_handle_rate_limit_exhausted(self, fake_sleep):
         """Test rate limit exhausted after max retries"""
         mock_func = Mock(side_effect=RateLimitError("test_service"))
         mock_logger = Mock()
@@ -345,35 +372,32 @@ class TestHandleRateLimit:
             handle_rate_limit(mock_func, "test_service", max_retries=2, logger=mock_logger)
         
         assert mock_logger.log_error.called
+        assert len(fake_sleep) == 2
 
 
 class TestSafeExecute:
     """Tests for safe_execute"""
     
-    def test_safe_execute_success(self):
-        """Test successful execution"""
-        mock_func = Mock(return_value="success")
-        
-        result = safe_execute(mock_func)
-        
-        assert result == "success"
-    
-    def test_safe_execute_with_error(self):
-        """Test execution with error returns default"""
-        mock_func = Mock(side_effect=Exception("Error"))
-        
-        result = safe_execute(mock_func, default_value="default")
-        
-        assert result == "default"
-    
-    def test_safe_execute_logs_error(self):
-        """Test that errors are logged"""
-        mock_func = Mock(side_effect=ValueError("Test error"))
+    @pytest.mark.parametrize("outcome,default,expected", [
+        ("success", None, "success"),
+        (Exception("Error"), "default", "default"),
+        (ValueError("Test error"), None, None),
+    ], ids=["success", "default_value", "default_none"])
+    def test_safe_execute(self, outcome, default, expected):
+        """Test result or default is returned and errors are logged"""
         mock_logger = Mock()
         
-        safe_execute(mock_func, logger=mock_logger, operation="test_op")
+        result = safe_execute(
+            _ScriptedCall(outcome),
+            default_value=default,
+            logger=mock_logger,
+            operation="test_op"
+        )
         
-        assert mock_logger.log_error.called
-        call_args = mock_logger.log_error.call_args
-        assert call_args[1]["error_type"] == "ValueError"
-        assert call_args[1]["context"]["operation"] == "test_op"
+        assert result == expected
+        if isinstance(outcome, Exception):
+            call_args = mock_logger.log_error.call_args
+            assert call_args[1]["error_type"] == type(outcome).__name__
+            assert call_args[1]["context"]["operation"] == "test_op"
+        else:
+            assert not mock_logger.log_error.called
@@ -5,9 +5,9 @@ Tests database initialization, CRUD operations, connection handling,
 and data size constraints.
 """
 
+import threading
+
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from uuid import UUID
 
@@ -15,33 +15,103 @@ from memory import MemorySystem, SessionSummary, SessionHistory
 from models.data_models import ToolResult, ResearchResult
 
 
+# Child tables first so rows never outlive the session they reference
+_TABLES = (
+    "research_results",
+    "confidence_scores",
+    "tool_executions",
+    "agent_decisions",
+    "sessions",
+)
+
+
+@pytest.fixture(scope="session")
+def shared_memory():
+    """In-memory memory system whose schema is created once per test session."""
+    memory = MemorySystem(db_path=":memory:")
+    yield memory
+    memory.close()
+
+
+@pytest.fixture
+def memory(shared_memory):
+    """Shared memory system, emptied again after each test."""
+    yield shared_memory
+    with shared_memory._get_connection() as conn:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+
+@pytest.fixture(scope="module")
+def research_result():
+    """Research result shared read-only by the final result tests."""
+    return ResearchResult.create_new(
+        goal="Test goal",
+        agents_involved=["research_agent", "analyst_agent"],
+        confidence_scores={
+            "research_agent": {"self": 85, "boss": 90},
+            "analyst_agent": {"self": 80, "boss": 85}
+        },
+        competitors=[{"name": "Company A", "url": "https://example.com"}],
+        insights=["Insight 1", "Insight 2"],
+        recommendations=[{"action": "Action 1", "priority": "high"}],
+        sources=[{"url": "https://example.com", "title": "Source 1"}],
+        overall_confidence=87
+    )
+
+
 class TestMemorySystem:
     """Tests for MemorySystem."""
     
     @pytest.fixture
-    def temp_db_path(self):
+    def temp_db_path(self, tmp_path):
         """Create temporary database path for tests."""
-        temp_dir = tempfile.mkdtemp()
-        db_path = Path(temp_dir) / "test_memory.db"
-        yield str(db_path)
-        shutil.rmtree(temp_dir)
-    
-    @pytest.fixture
-    def memory(self, temp_db_path):
-        """Create memory system instance for tests."""
-        memory = MemorySystem(db_path=temp_db_path)
-        yield memory
-        memory.close()
+        return str(tmp_path / "test_memory.db")
     
     def test_memory_initialization(self, temp_db_path):
         """Test memory system initialization creates database."""
-        memory = MemorySystem(db_path=temp_db_path)
+        memory = MemorySystem(db_path=temp_db_path, durable=False)
         
         # Check database file was created
         assert Path(temp_db_path).exists()
         
         memory.close()
     
+    def test_memory_initialization_from_path(self, tmp_path):
+        """Test memory system accepts a pathlib.Path database location."""
+        db_path = tmp_path / "nested" / "test_memory.db"
+        memory = MemorySystem(db_path=db_path, durable=False)
+        
+        session_id = memory.create_session("Test goal")
+        
+        assert db_path.exists()
+        assert memory.get_session_info(session_id) is not None
+        
+        memory.close()
+    
+    def test_in_memory_databases_are_isolated(self):
+        """Test that each ":memory:" memory system gets its own database."""
+        memory_1 = MemorySystem(db_path=":memory:")
+        memory_2 = MemorySystem(db_path=":memory:")
+        
+        session_id = memory_1.create_session("Test goal")
+        
+        assert memory_1.get_session_info(session_id) is not None
+        assert memory_2.get_session_info(session_id) is None
+        
+        memory_1.close()
+        memory_2.close()
+    
+    def test_non_durable_connections_skip_fsync(self, temp_db_path):
+        """Test that non-durable memory systems relax SQLite durability."""
+        memory = MemorySystem(db_path=temp_db_path, durable=False)
+        
+        with memory._get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        
+        memory.close()
+    
     def test_create_session(self, memory):
         """Test creating a new session."""
         session_id = memory.create_session("Research TapNex competitors")
@@ -133,22 +203,11 @@ class TestMemorySystem:
         assert scores["boss_score"] == 90
         assert scores["retry_count"] == 0
     
-    def test_store_final_result(self, memory):
+    def test_store_final_result(self, memory, research_result):
         """Test storing final research result."""
         session_id = memory.create_session("Test goal")
         
-        result = ResearchResult.create_new(
-            goal="Test goal",
-            agents_involved=["research_agent"],
-            confidence_scores={"research_agent": {"self": 85, "boss": 90}},
-            competitors=[{"name": "Company A"}],
-            insights=["Insight 1"],
-            recommendations=[{"action": "Action 1"}],
-            sources=[{"url": "https://example.com"}],
-            overall_confidence=87
-        )
-        
-        memory.store_final_result(session_id, result)
+        memory.store_final_result(session_id, research_result)
         
         # Retrieve session history
         history = memory.get_session_history(session_id)
@@ -243,13 +302,14 @@ class TestMemorySystem:
         session_id = memory.create_session("Test goal")
         
         # Store multiple decisions
-        for i in range(5):
-            memory.store_decision(
-                session_id,
-                f"agent_{i}",
-                f"decision_{i}",
-                {"index": i}
-            )
+        with memory.transaction():
+            for i in range(5):
+                memory.store_decision(
+                    session_id,
+                    f"agent_{i}",
+                    f"decision_{i}",
+                    {"index": i}
+                )
         
         # Retrieve history
         history = memory.get_session_history(session_id)
@@ -264,13 +324,14 @@ class TestMemorySystem:
         session_id = memory.create_session("Test goal")
         
         # Store multiple tool executions
-        for i in range(5):
-            memory.store_tool_output(
-                session_id,
-                f"tool_{i}",
-                ToolResult(success=True, data={"index": i}),
-                float(i)
-            )
+        with memory.transaction():
+            for i in range(5):
+                memory.store_tool_output(
+                    session_id,
+                    f"tool_{i}",
+                    ToolResult(success=True, data={"index": i}),
+                    float(i)
+                )
         
         # Retrieve history
         history = memory.get_session_history(session_id)
@@ -281,14 +342,15 @@ class TestMemorySystem:
         session_id = memory.create_session("Test goal")
         
         # Store multiple confidence scores (e.g., from retries)
-        for i in range(3):
-            memory.store_confidence_scores(
-                session_id,
-                "research_agent",
-                70 + i * 5,
-                75 + i * 5,
-                retry_count=i
-            )
+        with memory.transaction():
+            for i in range(3):
+                memory.store_confidence_scores(
+                    session_id,
+                    "research_agent",
+                    70 + i * 5,
+                    75 + i * 5,
+                    retry_count=i
+                )
         
         # Retrieve history
         history = memory.get_session_history(session_id)
@@ -298,41 +360,41 @@ class TestMemorySystem:
         for i, scores in enumerate(history.confidence_scores):
             assert scores["retry_count"] == i
     
-    def test_session_summary_to_dict(self):
-        """Test SessionSummary to_dict method."""
-        summary = SessionSummary(
-            session_id="test-id",
-            goal="Test goal",
-            created_at="2024-01-15T10:00:00",
-            completed_at="2024-01-15T10:30:00",
-            status="completed",
-            overall_confidence=85
-        )
+    def test_transaction_rolls_back_on_error(self, memory):
+        """Test that a failed transaction discards all of its writes."""
+        session_id = memory.create_session("Test goal")
+        
+        with pytest.raises(RuntimeError):
+            with memory.transaction():
+                memory.store_decision(session_id, "agent", "decision", {})
+                raise RuntimeError("abort")
         
-        summary_dict = summary.to_dict()
-        assert isinstance(summary_dict, dict)
-        assert summary_dict["session_id"] == "test-id"
-        assert summary_dict["goal"] == "Test goal"
-        assert summary_dict["overall_confidence"] == 85
+        history = memory.get_session_history(session_id)
+        assert history.decisions == []
     
-    def test_session_history_to_dict(self):
-        """Test SessionHistory to_dict method."""
-        history = SessionHistory(
-            session_id="test-id",
-            goal="Test goal",
-            created_at="2024-01-15T10:00:00",
-            completed_at="2024-01-15T10:30:00",
-            status="completed",
-            decisions=[],
-            tool_executions=[],
-            confidence_scores=[],
-            final_result=None
-        )
+    def test_transaction_not_shared_across_threads(self, temp_db_path):
+        """Test that other threads do not join an open transaction."""
+        memory = MemorySystem(db_path=temp_db_path, durable=False)
+        seen = {}
+        
+        def read_session(session_id):
+            try:
+                seen["info"] = memory.get_session_info(session_id)
+            except Exception as e:
+                seen["error"] = e
+        
+        with memory.transaction():
+            session_id = memory.create_session("Uncommitted goal")
+            reader = threading.Thread(target=read_session, args=(session_id,))
+            reader.start()
+            reader.join()
+        
+        # The reader used its own connection, so it saw only committed data
+        assert "error" not in seen
+        assert seen["info"] is None
+        assert memory.get_session_info(session_id) is not None
         
-        history_dict = history.to_dict()
-        assert isinstance(history_dict, dict)
-        assert history_dict["session_id"] == "test-id"
-        assert history_dict["goal"] == "Test goal"
+        memory.close()
     
     def test_tool_output_summarization(self, memory):
         """Test that tool outputs are summarized to prevent unbounded growth."""
@@ -386,23 +448,10 @@ class TestMemorySystem:
         
         assert retrieved_context == original_context
     
-    def test_final_result_persistence_round_trip(self, memory):
+    def test_final_result_persistence_round_trip(self, memory, research_result):
         """Test final result can be stored and retrieved correctly."""
         session_id = memory.create_session("Test goal")
-        
-        original_result = ResearchResult.create_new(
-            goal="Test goal",
-            agents_involved=["research_agent", "analyst_agent"],
-            confidence_scores={
-                "research_agent": {"self": 85, "boss": 90},
-                "analyst_agent": {"self": 80, "boss": 85}
-            },
-            competitors=[{"name": "Company A", "url": "https://example.com"}],
-            insights=["Insight 1", "Insight 2"],
-            recommendations=[{"action": "Action 1", "priority": "high"}],
-            sources=[{"url": "https://example.com", "title": "Source 1"}],
-            overall_confidence=87
-        )
+        original_result = research_result
         
         memory.store_final_result(session_id, original_result)
         
@@ -417,7 +466,7 @@ class TestMemorySystem:
     
     def test_connection_cleanup(self, temp_db_path):
         """Test that database connections are properly cleaned up."""
-        memory = MemorySystem(db_path=temp_db_path)
+        memory = MemorySystem(db_path=temp_db_path, durable=False)
         
         # Perform operations
         session_id = memory.create_session("Test")
@@ -427,10 +476,37 @@ class TestMemorySystem:
         memory.close()
         
         # Should be able to create new instance and access data
-        memory2 = MemorySystem(db_path=temp_db_path)
+        memory2 = MemorySystem(db_path=temp_db_path, durable=False)
         history = memory2.get_session_history(session_id)
         
         assert history is not None
         assert len(history.decisions) == 1
         
         memory2.close()
+
+
+_SESSION_FIELDS = {
+    "session_id": "test-id",
+    "goal": "Test goal",
+    "created_at": "2024-01-15T10:00:00",
+    "completed_at": "2024-01-15T10:30:00",
+    "status": "completed",
+}
+
+
+class TestSessionSerialization:
+    """Tests for SessionSummary and SessionHistory serialization."""
+    
+    @pytest.mark.parametrize("cls,kwargs", [
+        (SessionSummary, {**_SESSION_FIELDS, "overall_confidence": 85}),
+        (SessionHistory, {
+            **_SESSION_FIELDS,
+            "decisions": [],
+            "tool_executions": [],
+            "confidence_scores": [],
+            "final_result": None,
+        }),
+    ], ids=["summary", "history"])
+    def test_to_dict(self, cls, kwargs):
+        """Test to_dict returns every constructor field."""
+        assert cls(**kwargs).to_dict() == kwargs
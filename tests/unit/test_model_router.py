@@ -5,21 +5,73 @@ Tests model selection, fallback mechanism, performance tracking,
 and OpenRouter integration with mocked API calls.
 """
 
+import copy
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 
 from model_router import ModelRouter, TaskComplexity
 from models.data_models import ModelResponse
 
 
+# Keys every performance metrics entry and MODELS entry must carry
+_METRIC_FIELDS = frozenset({
+    "success_count", "failure_count", "total_tokens", "total_latency", "call_count"
+})
+_MODEL_FIELDS = frozenset({"id", "context", "complexity", "description"})
+
+# OpenRouter model ID -> model info, for asserting on select_model results
+_MODELS_BY_ID = {info["id"]: info for info in ModelRouter.MODELS.values()}
+
+
+def _fake_response(text, tokens=50):
+    """Minimal stand-in for an OpenAI chat completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=SimpleNamespace(total_tokens=tokens)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip real backoff sleeps in the fallback retry loop."""
+    monkeypatch.setattr("model_router.time.sleep", lambda *_: None)
+
+
+@pytest.fixture(scope="module")
+def shared_router():
+    """Model router built once for the module."""
+    return ModelRouter(api_key="test-api-key")
+
+
+@pytest.fixture
+def router(shared_router):
+    """Shared model router, with its metrics and client restored after each test."""
+    metrics = copy.deepcopy(shared_router.performance_metrics)
+    client = shared_router.client
+    yield shared_router
+    shared_router.performance_metrics = metrics
+    shared_router.client = client
+
+
+@pytest.fixture(scope="module")
+def shared_client():
+    """Mock OpenAI client reused across the module."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_client(router, shared_client):
+    """Shared mock client installed on the router and reset after each test."""
+    router.client = shared_client
+    yield shared_client
+    shared_client.reset_mock(return_value=True, side_effect=True)
+
+
 class TestModelRouter:
     """Tests for ModelRouter."""
     
-    @pytest.fixture
-    def router(self):
-        """Create model router instance with test API key."""
-        return ModelRouter(api_key="test-api-key")
-    
     def test_initialization(self):
         """Test model router initialization."""
         router = ModelRouter(api_key="test-key")
@@ -27,64 +79,28 @@ class TestModelRouter:
         assert router.client is not None
         assert len(router.performance_metrics) > 0
     
-    def test_select_model_simple_task(self, router):
-        """Test model selection for simple tasks."""
-        model = router.select_model(TaskComplexity.SIMPLE)
+    @pytest.mark.parametrize("complexity,requires_tag,ctx", [
+        (TaskComplexity.SIMPLE, None, None),
+        (TaskComplexity.COMPLEX, "complex", None),
+        (TaskComplexity.LONG_CONTEXT, "long", None),
+        (TaskComplexity.MODERATE, None, 5000),
+    ], ids=["simple", "complex", "long_context", "context_length"])
+    def test_select_model(self, router, complexity, requires_tag, ctx):
+        """Test model selection matches task complexity and context length."""
+        model = router.select_model(complexity, context_length=ctx)
         
-        # Should select a model suitable for simple tasks
-        assert model is not None
         assert isinstance(model, str)
-    
-    def test_select_model_complex_task(self, router):
-        """Test model selection for complex tasks."""
-        model = router.select_model(TaskComplexity.COMPLEX)
-        
-        # Should select a model suitable for complex tasks
-        assert model is not None
-        # Should be one of the complex-capable models
-        assert any(model_info["id"] == model 
-                  for model_info in router.MODELS.values()
-                  if "complex" in model_info["complexity"])
-    
-    def test_select_model_long_context(self, router):
-        """Test model selection for long context tasks."""
-        model = router.select_model(TaskComplexity.LONG_CONTEXT)
-        
-        assert model is not None
-        # Should select a model with long context support
-        assert any(model_info["id"] == model 
-                  for model_info in router.MODELS.values()
-                  if "long" in model_info["complexity"])
-    
-    def test_select_model_with_context_length(self, router):
-        """Test model selection considers context length."""
-        # Request model with specific context length
-        model = router.select_model(
-            TaskComplexity.MODERATE,
-            context_length=5000
-        )
-        
-        assert model is not None
-        # Should select a model that can handle the context length
-        selected_model_info = None
-        for model_info in router.MODELS.values():
-            if model_info["id"] == model:
-                selected_model_info = model_info
-                break
-        
+        selected_model_info = _MODELS_BY_ID.get(model)
         assert selected_model_info is not None
-        assert selected_model_info["context"] >= 5000
+        if requires_tag:
+            assert requires_tag in selected_model_info["complexity"]
+        if ctx:
+            assert selected_model_info["context"] >= ctx
     
-    @patch('model_router.OpenAI')
-    def test_call_model_success(self, mock_openai_class, router):
+    def test_call_model_success(self, router, mock_client):
         """Test successful model API call."""
         # Mock OpenAI client
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="Generated text"))]
-        mock_response.usage = Mock(total_tokens=100)
-        mock_client.chat.completions.create.return_value = mock_response
-        router.client = mock_client
+        mock_client.chat.completions.create.return_value = _fake_response("Generated text", 100)
         
         response = router.call_model(
             model="test-model",
@@ -99,13 +115,10 @@ class TestModelRouter:
         assert response.latency >= 0
         assert response.error is None
     
-    @patch('model_router.OpenAI')
-    def test_call_model_failure(self, mock_openai_class, router):
+    def test_call_model_failure(self, router, mock_client):
         """Test model API call failure."""
         # Mock OpenAI client to raise exception
-        mock_client = Mock()
         mock_client.chat.completions.create.side_effect = Exception("API Error")
-        router.client = mock_client
         
         response = router.call_model(
             model="test-model",
@@ -116,51 +129,25 @@ class TestModelRouter:
         assert response.text == ""
         assert response.error == "API Error"
     
-    @patch('model_router.OpenAI')
-    def test_call_with_fallback_success(self, mock_openai_class, router):
-        """Test call with fallback when primary succeeds."""
-        # Mock successful response
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="Success"))]
-        mock_response.usage = Mock(total_tokens=50)
-        mock_client.chat.completions.create.return_value = mock_response
-        router.client = mock_client
-        
-        response = router.call_with_fallback(
-            task_complexity=TaskComplexity.MODERATE,
-            prompt="Test prompt"
-        )
-        
-        assert response.success is True
-        assert response.text == "Success"
-    
-    @patch('model_router.OpenAI')
-    def test_call_with_fallback_retries(self, mock_openai_class, router):
-        """Test call with fallback retries on failure."""
-        # Mock client that fails first, then succeeds
-        mock_client = Mock()
-        
-        # First call fails
-        mock_client.chat.completions.create.side_effect = [
-            Exception("First failure"),
-            Mock(
-                choices=[Mock(message=Mock(content="Success on retry"))],
-                usage=Mock(total_tokens=50)
-            )
-        ]
-        router.client = mock_client
+    @pytest.mark.parametrize("side_effect,max_retries,expected_text,expected_calls", [
+        ([_fake_response("Success", 50)], 3, "Success", 1),
+        ([Exception("First failure"), _fake_response("Success on retry", 50)], 3, "Success on retry", 2),
+        (Exception("Always fails"), 2, None, 2),
+    ], ids=["primary_succeeds", "retry_succeeds", "max_retries_exhausted"])
+    def test_call_with_fallback(self, router, mock_client, side_effect, max_retries, expected_text, expected_calls):
+        """Test fallback retries across models up to max_retries."""
+        mock_client.chat.completions.create.side_effect = side_effect
         
         response = router.call_with_fallback(
             task_complexity=TaskComplexity.MODERATE,
             prompt="Test prompt",
-            max_retries=3
+            max_retries=max_retries
         )
         
-        # Should eventually succeed
-        assert response.success is True or response.success is False
-        # At least one retry should have been attempted
-        assert mock_client.chat.completions.create.call_count >= 1
+        assert response.success is (expected_text is not None)
+        if expected_text is not None:
+            assert response.text == expected_text
+        assert mock_client.chat.completions.create.call_count == expected_calls
     
     def test_performance_metrics_initialization(self, router):
         """Test that performance metrics are initialized for all models."""
@@ -168,22 +155,12 @@ class TestModelRouter:
         
         assert len(metrics) > 0
         for model_key, model_metrics in metrics.items():
-            assert "success_count" in model_metrics
-            assert "failure_count" in model_metrics
-            assert "total_tokens" in model_metrics
-            assert "total_latency" in model_metrics
-            assert "call_count" in model_metrics
+            assert _METRIC_FIELDS <= model_metrics.keys()
     
-    @patch('model_router.OpenAI')
-    def test_performance_metrics_tracking(self, mock_openai_class, router):
+    def test_performance_metrics_tracking(self, router, mock_client):
         """Test that performance metrics are tracked."""
         # Mock successful call
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="Text"))]
-        mock_response.usage = Mock(total_tokens=100)
-        mock_client.chat.completions.create.return_value = mock_response
-        router.client = mock_client
+        mock_client.chat.completions.create.return_value = _fake_response("Text", 100)
         
         # Get a model ID
         model_id = router.MODELS["gemma-4b"]["id"]
@@ -203,10 +180,7 @@ class TestModelRouter:
         info = router.get_model_info("qwen-4b")
         
         assert info is not None
-        assert "id" in info
-        assert "context" in info
-        assert "complexity" in info
-        assert "description" in info
+        assert _MODEL_FIELDS <= info.keys()
     
     def test_get_model_info_invalid(self, router):
         """Test getting info for invalid model returns None."""
@@ -228,13 +202,14 @@ class TestModelRouter:
         # Should prefer the model with better success rate
         assert model is not None
     
+    def test_model_ids_are_unique(self):
+        """Test that no two models share an OpenRouter ID."""
+        assert len(ModelRouter._MODEL_KEYS_BY_ID) == len(ModelRouter.MODELS)
+    
     def test_all_models_have_required_fields(self, router):
         """Test that all models have required configuration fields."""
         for model_key, model_info in router.MODELS.items():
-            assert "id" in model_info
-            assert "context" in model_info
-            assert "complexity" in model_info
-            assert "description" in model_info
+            assert _MODEL_FIELDS <= model_info.keys()
             assert isinstance(model_info["complexity"], list)
             assert len(model_info["complexity"]) > 0
     
@@ -245,38 +220,15 @@ class TestModelRouter:
         assert TaskComplexity.COMPLEX.value == "complex"
         assert TaskComplexity.LONG_CONTEXT.value == "long"
     
-    @patch('model_router.OpenAI')
-    def test_model_response_validation(self, mock_openai_class, router):
+    def test_model_response_validation(self, router, mock_client):
         """Test that ModelResponse is properly validated."""
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock(message=Mock(content="Test"))]
-        mock_response.usage = Mock(total_tokens=50)
-        mock_client.chat.completions.create.return_value = mock_response
-        router.client = mock_client
+        mock_client.chat.completions.create.return_value = _fake_response("Test", 50)
         
         response = router.call_model(model="test-model", prompt="Test")
         
         # Validate response
         assert response.validate() is True
     
-    @patch('model_router.OpenAI')
-    def test_max_retries_respected(self, mock_openai_class, router):
-        """Test that max_retries limit is respected."""
-        # Mock client that always fails
-        mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception("Always fails")
-        router.client = mock_client
-        
-        response = router.call_with_fallback(
-            task_complexity=TaskComplexity.MODERATE,
-            prompt="Test",
-            max_retries=2
-        )
-        
-        # Should not exceed max_retries
-        assert mock_client.chat.completions.create.call_count <= 2
-    
     def test_fallback_to_general_model(self, router):
         """Test fallback to general model when no suitable model found."""
         # Request with impossible context length
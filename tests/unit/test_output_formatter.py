@@ -5,6 +5,7 @@ Tests the output formatting functionality for research results.
 """
 
 import pytest
+import re
 import uuid
 from datetime import datetime
 from dataclasses import dataclass
@@ -13,6 +14,10 @@ from output_formatter import OutputFormatter
 from models.data_models import AgentOutput, ResearchResult
 
 
+# Canonical lowercase 8-4-4-4-12 UUID string
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
 # Create test agent outputs
 def create_test_output(agent_name="Test Agent", confidence=80):
     """Helper to create test AgentOutput."""
@@ -30,6 +35,18 @@ def create_test_output(agent_name="Test Agent", confidence=80):
     )
 
 
+@pytest.fixture(scope="module")
+def formatter():
+    """Output formatter shared across tests; it holds no state."""
+    return OutputFormatter()
+
+
+@pytest.fixture(scope="module")
+def default_output():
+    """Default agent output, shared read-only across tests."""
+    return create_test_output()
+
+
 class TestOutputFormatter:
     """Test suite for OutputFormatter class."""
     
@@ -38,77 +55,65 @@ class TestOutputFormatter:
         formatter = OutputFormatter()
         assert formatter is not None
     
-    def test_format_research_result_success(self):
+    @pytest.mark.parametrize("agents", [
+        [("Research Agent", 85)],
+        [("Research Agent", 85), ("Analyst Agent", 90), ("Strategy Agent", 88)],
+    ], ids=["single_agent", "multiple_agents"])
+    def test_format_research_result_success(self, formatter, agents):
         """Test formatting a successful research result."""
-        formatter = OutputFormatter()
-        
-        outputs = [
-            create_test_output("Research Agent", 85),
-            create_test_output("Analyst Agent", 90),
-            create_test_output("Strategy Agent", 88)
-        ]
+        outputs = [create_test_output(name, confidence) for name, confidence in agents]
+        names = [name for name, _ in agents]
         
         result = formatter.format_research_result("Research AI trends", outputs)
         
         assert result is not None
         assert result.goal == "Research AI trends"
-        assert len(result.agents_involved) == 3
-        assert "Research Agent" in result.agents_involved
+        assert sorted(result.agents_involved) == sorted(names)
+        assert set(result.confidence_scores) == set(names)
         assert len(result.insights) >= 1
         assert len(result.recommendations) >= 1
         assert 0 <= result.overall_confidence <= 100
     
-    def test_format_research_result_with_session_id(self):
+    def test_format_research_result_with_session_id(self, formatter, default_output):
         """Test formatting with provided session ID."""
-        formatter = OutputFormatter()
         session_id = str(uuid.uuid4())
         
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         result = formatter.format_research_result("Test goal", outputs, session_id=session_id)
         
         assert result.session_id == session_id
     
-    def test_format_research_result_generates_uuid(self):
+    def test_format_research_result_generates_uuid(self, formatter, default_output):
         """Test that UUID is generated if not provided."""
-        formatter = OutputFormatter()
-        
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         result = formatter.format_research_result("Test goal", outputs)
         
-        # Should be valid UUID
-        uuid.UUID(result.session_id)
+        # Should be a canonical UUID string
+        assert _UUID_RE.fullmatch(result.session_id)
     
-    def test_format_research_result_empty_goal(self):
+    def test_format_research_result_empty_goal(self, formatter, default_output):
         """Test that empty goal raises ValueError."""
-        formatter = OutputFormatter()
-        
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         with pytest.raises(ValueError, match="goal cannot be empty"):
             formatter.format_research_result("", outputs)
     
-    def test_format_research_result_no_outputs(self):
+    def test_format_research_result_no_outputs(self, formatter):
         """Test that no outputs raises ValueError."""
-        formatter = OutputFormatter()
-        
         with pytest.raises(ValueError, match="At least one agent output is required"):
             formatter.format_research_result("Test goal", [])
     
-    def test_format_research_result_invalid_session_id(self):
+    def test_format_research_result_invalid_session_id(self, formatter, default_output):
         """Test that invalid session ID raises ValueError."""
-        formatter = OutputFormatter()
-        
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         with pytest.raises(ValueError, match="Invalid session_id format"):
             formatter.format_research_result("Test goal", outputs, session_id="invalid-uuid")
     
-    def test_calculate_overall_confidence(self):
+    def test_calculate_overall_confidence(self, formatter):
         """Test overall confidence calculation."""
-        formatter = OutputFormatter()
-        
         confidence_scores = {
             "Research Agent": {"self": 80, "boss": 75},
             "Analyst Agent": {"self": 90, "boss": 85},
@@ -124,18 +129,14 @@ class TestOutputFormatter:
         expected = int((expected_self * 0.4) + (expected_boss * 0.6))
         assert abs(overall - expected) <= 1  # Allow 1 point rounding difference
     
-    def test_calculate_overall_confidence_empty(self):
+    def test_calculate_overall_confidence_empty(self, formatter):
         """Test overall confidence with no scores."""
-        formatter = OutputFormatter()
-        
         overall = formatter._calculate_overall_confidence({})
         
         assert overall == 0
     
-    def test_format_error_result(self):
+    def test_format_error_result(self, formatter):
         """Test formatting an error result."""
-        formatter = OutputFormatter()
-        
         result = formatter.format_error_result(
             "Test goal",
             "Tool execution failed",
@@ -148,10 +149,8 @@ class TestOutputFormatter:
         assert "failed" in result.insights[0].lower()
         assert len(result.recommendations) > 0
     
-    def test_format_error_result_with_partial_outputs(self):
+    def test_format_error_result_with_partial_outputs(self, formatter):
         """Test formatting error result with partial outputs."""
-        formatter = OutputFormatter()
-        
         partial_outputs = [create_test_output("Research Agent", 60)]
         
         result = formatter.format_error_result(
@@ -163,10 +162,8 @@ class TestOutputFormatter:
         assert "Research Agent" in result.agents_involved
         assert "Research Agent" in result.confidence_scores
     
-    def test_validate_result_success(self):
+    def test_validate_result_success(self, formatter):
         """Test validating a valid result."""
-        formatter = OutputFormatter()
-        
         result = ResearchResult.create_new(
             goal="Test goal",
             agents_involved=["Research Agent"],
@@ -180,10 +177,8 @@ class TestOutputFormatter:
         
         assert formatter.validate_result(result) is True
     
-    def test_validate_result_invalid_uuid(self):
+    def test_validate_result_invalid_uuid(self, formatter):
         """Test validation fails with invalid UUID."""
-        formatter = OutputFormatter()
-        
         result = ResearchResult.create_new(
             goal="Test goal",
             agents_involved=["Research Agent"],
@@ -200,43 +195,24 @@ class TestOutputFormatter:
         
         assert formatter.validate_result(result) is False
     
-    def test_format_preserves_goal(self):
+    def test_format_preserves_goal(self, formatter, default_output):
         """Test that goal is preserved exactly."""
-        formatter = OutputFormatter()
         goal = "Research the impact of AI on healthcare in 2024"
         
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         result = formatter.format_research_result(goal, outputs)
         
         assert result.goal == goal
     
-    def test_format_includes_timestamp(self):
+    def test_format_includes_timestamp(self, formatter, default_output):
         """Test that result includes valid timestamp."""
-        formatter = OutputFormatter()
-        
-        outputs = [create_test_output()]
+        outputs = [default_output]
         
         result = formatter.format_research_result("Test goal", outputs)
         
         # Should be valid ISO 8601 timestamp
-        datetime.fromisoformat(result.timestamp.replace('Z', '+00:00'))
-    
-    def test_format_with_multiple_agents(self):
-        """Test formatting with multiple different agents."""
-        formatter = OutputFormatter()
-        
-        outputs = [
-            create_test_output("Research Agent", 85),
-            create_test_output("Analyst Agent", 90),
-            create_test_output("Strategy Agent", 88)
-        ]
-        
-        result = formatter.format_research_result("Test goal", outputs)
-        
-        assert len(result.agents_involved) == 3
-        assert len(result.confidence_scores) == 3
-        assert all(agent in result.confidence_scores for agent in result.agents_involved)
+        datetime.fromisoformat(result.timestamp)
 
 
 if __name__ == "__main__":
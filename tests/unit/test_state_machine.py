@@ -7,8 +7,6 @@ and termination conditions.
 
 import pytest
 import time
-import tempfile
-import shutil
 from uuid import uuid4
 
 from agent_loop import StateMachine, AgentState, StateTransition
@@ -19,11 +17,9 @@ class TestStateMachine:
     """Tests for StateMachine."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path):
         """Create temporary log directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return str(tmp_path)
     
     @pytest.fixture
     def logger(self, temp_log_dir):
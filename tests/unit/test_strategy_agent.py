@@ -106,8 +106,7 @@ class TestStrategyAgent:
         agent = StrategyAgent()
         context = AgentContext(
             task_id="task_004",
-            task_description="create strategy",
-            previous_outputs={}
+            task_description="create strategy"
         )
         
         output = agent.execute(context)
@@ -417,8 +416,7 @@ class TestStrategyAgent:
         agent = StrategyAgent()
         context = AgentContext(
             task_id="task_011",
-            task_description="test",
-            previous_outputs={}
+            task_description="test"
         )
         
         output = agent.execute(context)
@@ -6,8 +6,6 @@ Tests each log method, log level filtering, file creation, and log rotation.
 
 import pytest
 import json
-import tempfile
-import shutil
 from pathlib import Path
 from uuid import uuid4
 
@@ -19,11 +17,9 @@ class TestStructuredLogger:
     """Tests for StructuredLogger."""
     
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path):
         """Create temporary log directory for tests."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+        return str(tmp_path)
     
     @pytest.fixture
     def logger(self, temp_log_dir):
@@ -341,7 +337,7 @@ class TestStructuredLogger:
         
         # Should be parseable
         from datetime import datetime
-        datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        datetime.fromisoformat(timestamp)
     
     def test_multiple_log_entries(self, logger, temp_log_dir):
         """Test logging multiple entries in sequence."""
@@ -375,6 +371,99 @@ class TestStructuredLogger:
         # Verify complex data is preserved
         assert logs[0]["data"] == complex_data
     
+    def test_in_memory_sink(self):
+        """Test logging to an in-memory sink without a log directory."""
+        logger = StructuredLogger(
+            session_id=str(uuid4()),
+            log_dir=None,
+            console_output=False,
+            sink=[]
+        )
+        
+        logger.log_info("Test message", {"key": "value"})
+        logger.log_debug("Filtered out")
+        
+        assert logger.log_file is None
+        assert len(logger.sink) == 1
+        assert logger.sink[0]["event_type"] == "info"
+        assert logger.sink[0]["data"]["key"] == "value"
+        
+        logger.close()
+    
+    def test_sink_alongside_file(self, temp_log_dir):
+        """Test that a sink receives the same entries written to file."""
+        sink = []
+        logger = StructuredLogger(
+            session_id=str(uuid4()),
+            log_dir=temp_log_dir,
+            console_output=False,
+            sink=sink
+        )
+        
+        logger.log_warning("Test warning")
+        
+        logs = StructuredLogger.get_session_logs(temp_log_dir, logger.session_id)
+        assert sink == logs
+        
+        logger.close()
+    
+    def test_recent_events_bounded(self):
+        """Test that recent_events keeps only the newest entries."""
+        logger = StructuredLogger(
+            session_id=str(uuid4()),
+            log_dir=None,
+            console_output=False,
+            recent_events_limit=2
+        )
+        
+        for i in range(3):
+            logger.log_info(f"Message {i}")
+        
+        events = logger.recent_events()
+        assert [event["message"] for event in events] == ["Message 1", "Message 2"]
+        # Without an explicit sink nothing else retains entries
+        assert logger.sink is None
+        
+        logger.close()
+    
+    def test_recent_events_snapshot_data(self):
+        """Test that mutating logged data afterwards does not alter history."""
+        sink = []
+        logger = StructuredLogger(
+            session_id=str(uuid4()),
+            log_dir=None,
+            console_output=False,
+            sink=sink
+        )
+        
+        data = {"key": "value"}
+        logger.log_info("Test message", data)
+        data["key"] = "changed"
+        
+        assert logger.recent_events()[0]["data"] == {"key": "value"}
+        assert sink[0]["data"] == {"key": "value"}
+    
+    def test_recent_events_snapshot_nested_data(self):
+        """Test that mutating nested logged values afterwards does not alter history."""
+        sink = []
+        logger = StructuredLogger(
+            session_id=str(uuid4()),
+            log_dir=None,
+            console_output=False,
+            sink=sink
+        )
+        
+        data = {"agent": {"state": "idle"}, "steps": ["plan"]}
+        logger.log_info("Test message", data)
+        data["agent"]["state"] = "running"
+        data["steps"].append("execute")
+        
+        expected = {"agent": {"state": "idle"}, "steps": ["plan"]}
+        assert logger.recent_events()[0]["data"] == expected
+        assert sink[0]["data"] == expected
+        
+        logger.close()
+    
     def test_get_session_logs_nonexistent(self, temp_log_dir):
         """Test getting logs for non-existent session returns empty list."""
         logs = StructuredLogger.get_session_logs(temp_log_dir, "nonexistent-session")